@@ -0,0 +1,124 @@
+"""
+Measure card loading time for generated rosters of different sizes.
+
+Every run happens in a fresh interpreter with an empty bytecode cache, comparing the serial
+loader, the thread-pool loader and a boot from an up-to-date card catalog.
+
+Run from the repository root: python -m benchmarks.bench_card_loading [--cards 50 200 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from durin_tcg.enums import CardElement
+
+GAME_CLASSES = {"genshin": "GenshinCard", "hsr": "HSRCard", "zzz": "ZZZCard"}
+
+CARD_TEMPLATE = """from __future__ import annotations
+
+from durin_tcg.enums import CardElement
+from durin_tcg.models.cards import {base}
+
+
+class {cls}({base}):
+    def __init__(self) -> None:
+        super().__init__(
+            name="{name}",
+            desc="Generated benchmark card number {index}.",
+            element=CardElement.{element},
+        )
+"""
+
+# Runs inside the child interpreter, after CARD_ROOT/CARD_CATALOG_FILE point at the roster
+CHILD_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from durin_tcg.utils.reading_cards import read_cards
+cards = read_cards(use_catalog=sys.argv[1] == "catalog", workers=int(sys.argv[2]))
+print(json.dumps({"seconds": time.perf_counter() - start, "cards": len(cards)}))
+"""
+
+
+def generate_roster(root: pathlib.Path, count: int) -> None:
+    elements = list(CardElement.__members__)
+    for index in range(count):
+        game = list(GAME_CLASSES)[index % len(GAME_CLASSES)]
+        folder = root / game
+        folder.mkdir(parents=True, exist_ok=True)
+        (folder / f"card_{index:04d}.py").write_text(
+            CARD_TEMPLATE.format(
+                base=GAME_CLASSES[game],
+                cls=f"Card{index:04d}",
+                name=f"Card {index:04d}",
+                index=index,
+                element=elements[index % len(elements)],
+            ),
+            encoding="utf-8",
+        )
+
+
+def clear_bytecode(root: pathlib.Path) -> None:
+    for cache in root.glob("*/__pycache__"):
+        shutil.rmtree(cache)
+
+
+def run_child(workdir: pathlib.Path, roster: pathlib.Path, mode: str, workers: int) -> dict:
+    env = {
+        **os.environ,
+        "DISCORD_TOKEN": os.environ.get("DISCORD_TOKEN", "benchmark"),
+        "TEST_GUILD_ID": os.environ.get("TEST_GUILD_ID", "0"),
+        "USER_DATA_FILE": str(workdir / "user_data.json"),
+        "CARD_ROOT": str(roster),
+        "CARD_CATALOG_FILE": str(workdir / "card_catalog.json"),
+        "PYTHONPATH": os.pathsep.join([str(pathlib.Path.cwd()), os.environ.get("PYTHONPATH", "")]),
+    }
+    result = subprocess.run(
+        [sys.executable, "-c", CHILD_SCRIPT, mode, str(workers)],
+        cwd=workdir,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run(count: int, workers: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = pathlib.Path(tmp)
+        (workdir / "logs").mkdir()
+        roster = workdir / "cards"
+        generate_roster(roster, count)
+
+        clear_bytecode(roster)
+        serial = run_child(workdir, roster, "full", 0)
+        clear_bytecode(roster)
+        parallel = run_child(workdir, roster, "full", workers)
+        catalog = run_child(workdir, roster, "catalog", 0)
+
+    print(f"{count} cards")
+    print(f"  serial import          {serial['seconds']:8.3f}s")
+    print(f"  parallel ({workers} workers)   {parallel['seconds']:8.3f}s")
+    print(f"  from catalog           {catalog['seconds']:8.3f}s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cards", type=int, nargs="+", default=[50, 200, 1000])
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    args = parser.parse_args()
+
+    for count in args.cards:
+        run(count, args.workers)
+
+
+if __name__ == "__main__":
+    main()
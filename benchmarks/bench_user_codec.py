@@ -0,0 +1,82 @@
+"""
+Compare the binary user codec against the JSON path used by save_all_users/load_all_users.
+
+Run from the repository root: python -m benchmarks.bench_user_codec [--users 10000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import time
+from typing import TYPE_CHECKING
+
+from durin_tcg.models.card_registry import CardSet
+from durin_tcg.models.user import CardDeck, CardSettings, TCGUser
+from durin_tcg.utils.user_codec import decode_user, encode_user
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+CARD_POOL = [f"Card {i}" for i in range(60)]
+
+
+def make_users(count: int, seed: int = 0) -> dict[str, TCGUser]:
+    rng = random.Random(seed)
+    users = {}
+    for uid in range(count):
+        owned = rng.sample(CARD_POOL, rng.randint(4, 30))
+        users[str(10**17 + uid)] = TCGUser(
+            owned_cards=CardSet(owned),
+            decks=[
+                CardDeck(name=f"Deck {i}", cards=rng.sample(owned, 4))
+                for i in range(rng.randint(0, 3))
+            ],
+            currency=rng.randint(0, 10_000),
+            card_settings=[CardSettings(card_name=card) for card in owned[:2]],
+            card_pity=rng.randint(0, 80),
+        )
+    return users
+
+
+def timed[T](func: Callable[[], T]) -> tuple[float, T]:
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+
+def run(count: int) -> None:
+    users = make_users(count)
+
+    json_save, json_blob = timed(
+        lambda: json.dumps(
+            {uid: user.model_dump(mode="json") for uid, user in users.items()}, indent=4
+        )
+    )
+    json_load, _ = timed(
+        lambda: {uid: TCGUser(**data) for uid, data in json.loads(json_blob).items()}
+    )
+
+    bin_save, records = timed(lambda: {uid: encode_user(user) for uid, user in users.items()})
+    bin_load, _ = timed(lambda: {uid: decode_user(data) for uid, data in records.items()})
+
+    bin_size = sum(len(data) for data in records.values())
+    print(f"{count} users")
+    print(
+        f"  json     save {json_save:8.3f}s  load {json_load:8.3f}s  size {len(json_blob) / 1e6:8.2f} MB"
+    )
+    print(f"  binary   save {bin_save:8.3f}s  load {bin_load:8.3f}s  size {bin_size / 1e6:8.2f} MB")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    for count in args.users:
+        run(count)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Check the vectorized battle evaluator against the object engine and compare their throughput.
+
+The consistency check plays the same random turns through BattleBatch and through Battle.step
+and compares every character and action point count after every tick; it exits with status 1
+on the first difference.
+
+Run from the repository root: python -m benchmarks.bench_vectorized [--games 1000 100000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from durin_tcg.models.battle_state import SWITCH_ACTION
+from durin_tcg.models.game import Battle
+from durin_tcg.simulation.engine import build_player, simulate
+from durin_tcg.simulation.policies import RandomPolicy
+from durin_tcg.simulation.vectorized import (
+    NO_SWITCH,
+    BattleBatch,
+    random_policy,
+    simulate_vectorized,
+)
+from durin_tcg.utils.reading_cards import read_cards
+
+if TYPE_CHECKING:
+    from durin_tcg.models.cards import Card
+
+DECK_SIZE = 4
+
+
+def deck(names: list[str], offset: int) -> list[str]:
+    """DECK_SIZE cards starting at ``offset``, wrapping around small catalogs."""
+    return [names[(offset + i) % len(names)] for i in range(DECK_SIZE)]
+
+
+def compare(battles: list[Battle], batch: BattleBatch) -> str | None:
+    """Describe the first difference between the battles and the batch, if any."""
+    for game, battle in enumerate(battles):
+        for player, side in enumerate((battle.player1, battle.player2)):
+            for index, char in enumerate(side.deck):
+                expected = (char.current_hp, char.current_shield, char.auras)
+                actual = (
+                    int(batch.hp[game, player, index]),
+                    int(batch.shield[game, player, index]),
+                    int(batch.auras[game, player, index]),
+                )
+                if expected != actual:
+                    return f"game {game}, player {player + 1}, character {index}: {expected} != {actual}"
+            if side.deck.index(side.active_character) != batch.active[game, player]:
+                return f"game {game}, player {player + 1}: active character differs"
+            if side.action_points != batch.action_points[game, player]:
+                return f"game {game}, player {player + 1}: action points differ"
+        if (0 if battle.player1_turn else 1) != batch.turn[game]:
+            return f"game {game}: turn differs"
+    return None
+
+
+def check_consistency(cards: dict[str, Card], games: int, seed: int) -> str | None:
+    rng = np.random.default_rng(seed)
+    names = sorted(cards)
+    battles = []
+    # Catalogs smaller than a deck repeat cards, like the deck() fallback
+    replace = len(names) < DECK_SIZE
+    for _ in range(games):
+        deck1, deck2 = (
+            [names[i] for i in rng.choice(len(names), DECK_SIZE, replace=replace)] for _ in range(2)
+        )
+        battles.append(Battle(build_player(cards, deck1), build_player(cards, deck2), seed=seed))
+    batch = BattleBatch.from_battles(battles)
+
+    while not batch.done().all():
+        done = batch.done()
+        player1 = batch.turn == 0
+        switch1, action1 = random_policy(batch, 0, rng)
+        switch2, action2 = random_policy(batch, 1, rng)
+        switch = np.where(player1, switch1, switch2)
+        action = np.where(player1, action1, action2)
+
+        for game, battle in enumerate(battles):
+            if done[game]:
+                continue
+            if switch[game] != NO_SWITCH:
+                battle.step(SWITCH_ACTION + int(switch[game]))
+            battle.step(int(action[game]))
+
+        batch.step(switch, action)
+        if (difference := compare(battles, batch)) is not None:
+            return difference
+    return None
+
+
+def run(cards: dict[str, Card], games: int, deck1: list[str], deck2: list[str]) -> None:
+    start = time.perf_counter()
+    simulate(cards, deck1, deck2, RandomPolicy(), RandomPolicy(), games=games)
+    objects = time.perf_counter() - start
+
+    start = time.perf_counter()
+    simulate_vectorized(cards, deck1, deck2, random_policy, random_policy, games=games)
+    vectorized = time.perf_counter() - start
+
+    print(
+        f"{games:>8} games: objects {games / objects:>12,.0f} games/s, "
+        f"vectorized {games / vectorized:>12,.0f} games/s ({objects / vectorized:.1f}x)"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--games", type=int, nargs="+", default=[1000, 10_000, 100_000])
+    parser.add_argument("--check-games", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    cards = read_cards()
+
+    difference = check_consistency(cards, args.check_games, args.seed)
+    if difference is not None:
+        print(f"Vectorized evaluator diverged from the object engine: {difference}")
+        sys.exit(1)
+    print(f"{args.check_games} random battles match the object engine")
+
+    names = sorted(cards)
+    for games in args.games:
+        run(cards, games, deck(names, 0), deck(names, DECK_SIZE))
+
+
+if __name__ == "__main__":
+    main()
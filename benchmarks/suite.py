@@ -0,0 +1,274 @@
+"""
+Micro-benchmarks for the battle engine, card loading, user storage and translations.
+
+Every case is timed with timeit's autorange and the best of --repeat runs is reported per
+operation. Results can be written as JSON and compared against an earlier JSON run, in which
+case the exit status is 1 if any case got slower than --threshold allows.
+
+Run from the repository root:
+    python -m benchmarks.suite --json bench.json
+    python -m benchmarks.suite --baseline bench.json [--threshold 0.15] [-k battle]
+
+Cold card imports need a fresh interpreter per run and stay in bench_card_loading.py.
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import json
+import logging
+import pathlib
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from typing import TYPE_CHECKING, Any
+
+from discord import Locale
+
+from benchmarks.bench_user_codec import make_users
+from durin_tcg.enums import CardAbility, CardElement
+from durin_tcg.l10n import LocaleStr, translator
+from durin_tcg.models.ai_search import search
+from durin_tcg.models.battle_state import ACTION_SKILL, BattleState
+from durin_tcg.models.cards import GenshinCard
+from durin_tcg.models.game import Battle, Character, Player
+from durin_tcg.utils import reading_cards, reading_users
+from durin_tcg.utils.reading_cards import read_cards
+from durin_tcg.utils.user_codec import decode_user, encode_user
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from durin_tcg.models.cards import Card
+
+type Setup = Callable[[argparse.Namespace], Callable[[], object]]
+
+CASES: dict[str, Setup] = {}
+_CARDS: dict[str, Card] = {}
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark; its setup returns the operation to time."""
+
+    def decorator(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+
+    return decorator
+
+
+def cards() -> dict[str, Card]:
+    if not _CARDS:
+        _CARDS.update(read_cards())
+    return _CARDS
+
+
+def make_player(offset: int = 0) -> Player:
+    names = sorted(cards())
+    deck = [Character(cards()[names[(offset + i) % len(names)]]) for i in range(4)]
+    return Player(deck, deck[0])
+
+
+def make_battle() -> Battle:
+    return Battle(make_player(), make_player(4), seed=0)
+
+
+@case("battle.step")
+def bench_battle_step(_args: argparse.Namespace) -> Callable[[], object]:
+    battle = make_battle()
+    start = BattleState.from_battle(battle)
+
+    def op() -> None:
+        start.apply_to(battle)
+        battle.events.clear()
+        battle.step(ACTION_SKILL)
+
+    return op
+
+
+@case("ability.default_attack")
+def bench_default_attack(_args: argparse.Namespace) -> Callable[[], object]:
+    battle = make_battle()
+    start = BattleState.from_battle(battle)
+    attacker = battle.player1
+    ability = attacker.active_character.card.abilities[ACTION_SKILL]
+
+    def op() -> None:
+        start.apply_to(battle)
+        ability.default_attack(attacker.deck, battle.player2)
+
+    return op
+
+
+@case("player.use_ability")
+def bench_use_ability(_args: argparse.Namespace) -> Callable[[], object]:
+    battle = make_battle()
+    start = BattleState.from_battle(battle)
+
+    def op() -> None:
+        start.apply_to(battle)
+        battle.player1.use_ability(CardAbility.SKILL, battle.player2)
+
+    return op
+
+
+@case("battle.play_game")
+def bench_play_game(_args: argparse.Namespace) -> Callable[[], object]:
+    return lambda: make_battle().play_game()
+
+
+@case("battle_state.apply_undo")
+def bench_state_apply_undo(_args: argparse.Namespace) -> Callable[[], object]:
+    state = BattleState.from_battle(make_battle())
+    return lambda: state.undo(state.apply(ACTION_SKILL))
+
+
+@case("battle_state.clone")
+def bench_state_clone(_args: argparse.Namespace) -> Callable[[], object]:
+    state = BattleState.from_battle(make_battle())
+    return state.clone
+
+
+@case("ai.search_2000_nodes")
+def bench_search(_args: argparse.Namespace) -> Callable[[], object]:
+    state = BattleState.from_battle(make_battle())
+    return lambda: search(state, time_limit=60, node_budget=2000)
+
+
+@case("cards.construct")
+def bench_card_construct(_args: argparse.Namespace) -> Callable[[], object]:
+    return lambda: GenshinCard("Benchmark", "A benchmark card.", CardElement.GI_PYRO)
+
+
+@case("cards.read_cards_catalog")
+def bench_read_cards_catalog(_args: argparse.Namespace) -> Callable[[], object]:
+    read_cards()  # Make sure the catalog is up to date
+    return read_cards
+
+
+@case("cards.read_cards_import")
+def bench_read_cards_import(_args: argparse.Namespace) -> Callable[[], object]:
+    return lambda: read_cards(use_catalog=False)
+
+
+@case("users.save_all_users")
+def bench_save_all_users(args: argparse.Namespace) -> Callable[[], object]:
+    users = make_users(args.users)
+    return lambda: reading_users.save_all_users(users)
+
+
+@case("users.load_all_users")
+def bench_load_all_users(args: argparse.Namespace) -> Callable[[], object]:
+    reading_users.save_all_users(make_users(args.users))
+    return reading_users.load_all_users
+
+
+@case("users.encode")
+def bench_encode_users(args: argparse.Namespace) -> Callable[[], object]:
+    users = list(make_users(args.users).values())
+    return lambda: [encode_user(user) for user in users]
+
+
+@case("users.decode")
+def bench_decode_users(args: argparse.Namespace) -> Callable[[], object]:
+    records = [encode_user(user) for user in make_users(args.users).values()]
+    return lambda: [decode_user(data) for data in records]
+
+
+@case("l10n.translate")
+def bench_translate(_args: argparse.Namespace) -> Callable[[], object]:
+    string = LocaleStr("info.ping", latency=0.042)
+    return lambda: translator.translate(string, Locale.japanese)
+
+
+def measure(op: Callable[[], object], repeat: int) -> dict[str, Any]:
+    timer = timeit.Timer(op)
+    loops, _ = timer.autorange()
+    runs = [total / loops for total in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "seconds": min(runs),
+        "median_seconds": statistics.median(runs),
+        "loops": loops,
+        "repeat": repeat,
+    }
+
+
+def format_seconds(seconds: float) -> str:
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:8.2f} {unit}"
+    return f"{seconds / 1e-9:8.2f} ns"
+
+
+def compare(
+    results: dict[str, dict[str, Any]], baseline: dict[str, dict[str, Any]], threshold: float
+) -> list[str]:
+    """Print each case's change against the baseline and return the regressed cases."""
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:32} (not in baseline)")
+            continue
+        ratio = result["seconds"] / baseline[name]["seconds"]
+        regressed = ratio > 1 + threshold
+        if regressed:
+            regressions.append(name)
+        flag = "REGRESSION" if regressed else ""
+        print(f"{name:32} {ratio:6.2f}x  {flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-k", "--filter", default="", help="only run cases containing this")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--users", type=int, default=10_000, help="users for users.* cases")
+    parser.add_argument("--json", type=pathlib.Path, help="write results to this file")
+    parser.add_argument("--baseline", type=pathlib.Path, help="compare against this file")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+
+    results: dict[str, dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        # save_all_users/load_all_users and the read_cards cases must not touch the real
+        # user file and card catalog
+        reading_users.USER_DATA_FILE = pathlib.Path(tmp) / "user_data.json"
+        reading_cards.CARD_CATALOG_FILE = pathlib.Path(tmp) / "card_catalog.json"
+
+        for name, setup in CASES.items():
+            if args.filter not in name:
+                continue
+            results[name] = measure(setup(args), args.repeat)
+            print(f"{name:32} {format_seconds(results[name]['seconds'])}/op")
+
+    if args.json:
+        args.json.write_text(
+            json.dumps(
+                {
+                    "created": datetime.datetime.now(datetime.UTC).isoformat(),
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "users": args.users,
+                    "results": results,
+                },
+                indent=2,
+            ),
+            encoding="utf-8",
+        )
+
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+        print(f"\nCompared with {args.baseline} ({baseline['created']}):")
+        if compare(results, baseline["results"], args.threshold):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
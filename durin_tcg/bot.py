@@ -4,6 +4,7 @@ Copied and Edited from Python-Discord-Bot-Template: https://github.com/kkrypt0nn
 
 from __future__ import annotations
 
+import asyncio
 import os
 import platform
 from pathlib import Path
@@ -13,6 +14,9 @@ import discord
 from discord.ext import commands, tasks
 
 from durin_tcg.models.game_data import GameData
+from durin_tcg.utils.ai_move_service import AIMoveService
+from durin_tcg.utils.deadlines import DEADLINES
+from durin_tcg.utils.outbound import OUTBOUND
 
 from .utils.logger import LOGGER
 
@@ -27,6 +31,8 @@ class DurinBot(commands.Bot):
         self.initialised = False
         self.logger = LOGGER
         self.game_data = GameData()
+        self.ai_moves = AIMoveService()
+        self.write_behind_task: asyncio.Task | None = None
 
     async def _load_cogs(self) -> None:
         for filepath in Path("durin_tcg/cogs").glob("**/*.py"):
@@ -61,8 +67,21 @@ class DurinBot(commands.Bot):
         self.logger.info("Running on %s %s (%s)", platform.system(), platform.release(), os.name)
         self.logger.info("-------------------")
 
+        self.ai_moves.start()
         await self._load_cogs()
         self.status_task.start()
+        self.write_behind_task = asyncio.create_task(self.game_data.run_write_behind())
+
+    async def close(self) -> None:
+        await super().close()
+        self.ai_moves.close()
+        DEADLINES.close()
+        OUTBOUND.close()
+
+        if self.write_behind_task is not None:
+            self.write_behind_task.cancel()
+        # Force out anything the write-behind task has not flushed yet
+        await self.game_data.close()
 
     async def on_message(self, message: discord.Message) -> None:
         if message.author == self.user or message.author.bot:
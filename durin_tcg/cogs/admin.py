@@ -9,6 +9,8 @@ from discord.ext.commands import Context
 
 from durin_tcg.bot import DurinBot
 from durin_tcg.l10n import LocaleStr
+from durin_tcg.utils.deadlines import DEADLINES
+from durin_tcg.utils.outbound import OUTBOUND
 
 if TYPE_CHECKING:
     from durin_tcg.bot import DurinBot
@@ -17,7 +19,7 @@ LOCALE_NAME_MAP = {loc.value: loc for loc in discord.Locale}
 
 
 class Admin(commands.Cog):
-    def __init__(self, bot: commands.Bot) -> None:
+    def __init__(self, bot: DurinBot) -> None:
         self.bot = bot
 
     @commands.command()
@@ -30,6 +32,67 @@ class Admin(commands.Cog):
         )
         await context.send(embed=embed)
 
+    @commands.command()
+    @commands.is_owner()
+    async def reloadcards(self, context: Context) -> None:
+        changes = await self.bot.game_data.reload_cards()
+        embed = discord.Embed(
+            title="Cards Reloaded",
+            description=f"{len(self.bot.game_data.cards)} cards are now available.",
+            color=0xBEBEFE,
+        )
+        for label, names in changes.items():
+            if names:
+                embed.add_field(name=label.capitalize(), value=", ".join(names), inline=False)
+        await context.send(embed=embed)
+
+    @commands.command()
+    @commands.is_owner()
+    async def stats(self, context: Context) -> None:
+        cache = self.bot.game_data.cache_stats()
+        embed = discord.Embed(title="Runtime Stats", color=0xBEBEFE)
+        embed.add_field(
+            name="User Cache",
+            value=(
+                f"Resident: {cache['resident']}\n"
+                f"Hit rate: {cache['hit_rate']:.1%} ({cache['hits']} hits, {cache['misses']} misses)\n"
+                f"Evictions: {cache['evictions']}"
+            ),
+            inline=False,
+        )
+        ai = self.bot.ai_moves.stats()
+        embed.add_field(
+            name="AI Moves",
+            value=(
+                f"Workers: {ai['workers']} ({ai['running']} running, {ai['waiting']} waiting)\n"
+                f"Completed: {ai['completed']} ({ai['nodes_per_second']:,.0f} nodes/s)\n"
+                f"Timeouts: {ai['timeouts']}, rejected: {ai['rejected']}"
+            ),
+            inline=False,
+        )
+        deadlines = DEADLINES.stats()
+        embed.add_field(
+            name="Turn Deadlines",
+            value=(
+                f"Armed: {deadlines['armed']}\n"
+                f"Expired: {deadlines['dispatched']}, cancelled: {deadlines['cancelled']}\n"
+                f"Dispatch lag: {deadlines['mean_lag'] * 1000:.1f}ms mean, "
+                f"{deadlines['max_lag'] * 1000:.1f}ms max"
+            ),
+            inline=False,
+        )
+        outbound = OUTBOUND.stats()
+        embed.add_field(
+            name="Outbound Messages",
+            value=(
+                f"Queued: {outbound['depth']} (max {outbound['max_depth']})\n"
+                f"Sent: {outbound['sent']}, failed: {outbound['failed']}\n"
+                f"Superseded edits: {outbound['superseded']}"
+            ),
+            inline=False,
+        )
+        await context.send(embed=embed)
+
     @app_commands.command(
         name="test_locale", description="Test a translation with a different locale."
     )
@@ -11,12 +11,14 @@ from durin_tcg.commands.battling import BattleCommand
 if TYPE_CHECKING:
     from durin_tcg.bot import DurinBot
     from durin_tcg.models.game_data import GameData
+    from durin_tcg.utils.ai_move_service import AIMoveService
 
 
 class Battling(commands.GroupCog, name="battle"):
-    def __init__(self, bot: commands.Bot, game_data: GameData) -> None:
+    def __init__(self, bot: commands.Bot, game_data: GameData, ai_moves: AIMoveService) -> None:
         self.bot = bot
         self.game_data = game_data
+        self.ai_moves = ai_moves
 
     @app_commands.command(name="profile", description="See your battle profile")
     async def battle_profile(self, interaction: discord.Interaction) -> None:
@@ -26,6 +28,13 @@ class Battling(commands.GroupCog, name="battle"):
 
     @app_commands.command(name="ai", description="Challenge an AI.")
     async def challenge_ai(self, interaction: discord.Interaction) -> None:
+        if self.ai_moves.is_saturated:
+            await interaction.response.send_message(
+                "The AI is busy with too many battles right now, try again in a moment.",
+                ephemeral=True,
+            )
+            return
+
         await self._battle_command(interaction, "AI")
 
     @app_commands.command(name="player", description="Challenge another player")
@@ -42,12 +51,20 @@ class Battling(commands.GroupCog, name="battle"):
     async def _battle_command(
         self, interaction: discord.Interaction, opponent: discord.User | Literal["AI"]
     ) -> None:
+        # Load both players now, so the battle views only ever hit the user cache
+        await self.game_data.fetch_user(str(interaction.user.id))
+        if opponent != "AI":
+            await self.game_data.fetch_user(str(opponent.id))
+
         command = BattleCommand(
-            challenger=interaction.user, opponent=opponent, game_data=self.game_data
+            challenger=interaction.user,
+            opponent=opponent,
+            game_data=self.game_data,
+            ai_moves=self.ai_moves,
         )
 
         await command.send_invite(interaction)
 
 
 async def setup(bot: DurinBot) -> None:
-    await bot.add_cog(Battling(bot, bot.game_data))
+    await bot.add_cog(Battling(bot, bot.game_data, bot.ai_moves))
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
-from collections import defaultdict
 from typing import TYPE_CHECKING
 
 import discord
 from discord import app_commands
 from discord.ext import commands
 
-from durin_tcg.enums import Game
-from durin_tcg.models.cards import Card
 from durin_tcg.views.card_album_view import CardAlbumPaginator
 
 if TYPE_CHECKING:
@@ -27,14 +24,14 @@ class CardGame(commands.GroupCog, name="cards"):
 
         uid = str(interaction.user.id)
 
-        if uid not in self.game_data.users:
+        if not await self.game_data.user_exists(uid):
             self.game_data.add_user(uid)
             await interaction.followup.send(
                 "You don't own any cards yet, but your Durin TCG account has been created. Please use `/warp` to get some cards."
             )
             return
 
-        user = self.game_data.get_user(uid)
+        user = await self.game_data.fetch_user(uid)
 
         if not user.owned_cards:
             await interaction.followup.send(
@@ -42,13 +39,9 @@ class CardGame(commands.GroupCog, name="cards"):
             )
             return
 
-        embed = discord.Embed(
-            title=f"{interaction.user.display_name}'s Card Collection", color=discord.Color.green()
+        embed = self.game_data.card_embeds.collection(
+            f"{interaction.user.display_name}'s Card Collection", user.owned_cards
         )
-
-        for card in user.owned_cards:
-            embed.add_field(name=card, value="", inline=False)
-
         await interaction.followup.send(embed=embed)
 
     @app_commands.command(name="all", description="List all available cards.")
@@ -58,23 +51,7 @@ class CardGame(commands.GroupCog, name="cards"):
             await interaction.response.send_message("No cards found.", ephemeral=True)
             return
 
-        cards_by_game: dict[Game, list[Card]] = defaultdict(list)
-        for card in cards.values():
-            cards_by_game[card.game].append(card)
-
-        embed = discord.Embed(
-            title="All Available Cards",
-            description="Here's a list of all cards and their elements:",
-            color=discord.Color.blurple(),
-        )
-
-        for game in sorted(cards_by_game.keys()):
-            card_lines = [
-                f"• **{card.name}** — {card.element.value}"
-                for card in sorted(cards_by_game[game], key=lambda c: c.name)
-            ]
-            embed.add_field(name=f"{game.value} Cards", value="\n".join(card_lines), inline=False)
-
+        embed = self.game_data.card_embeds.catalog(interaction.locale)
         await interaction.response.send_message(embed=embed)
 
     @app_commands.command(name="album", description="List cards in an album format.")
@@ -84,7 +61,7 @@ class CardGame(commands.GroupCog, name="cards"):
             await interaction.response.send_message("No cards found.")
             return
 
-        user = self.game_data.get_user(str(interaction.user.id))
+        user = await self.game_data.fetch_user(str(interaction.user.id))
 
         if not user or not user.owned_cards:
             await interaction.response.send_message(
@@ -92,7 +69,7 @@ class CardGame(commands.GroupCog, name="cards"):
             )
             return
 
-        view = CardAlbumPaginator(user.owned_cards, cards)
+        view = CardAlbumPaginator(user.owned_cards, self.game_data.card_embeds, interaction.locale)
         await interaction.response.send_message(embed=view._get_embed(), view=view)
 
 
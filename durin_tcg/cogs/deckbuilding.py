@@ -26,14 +26,14 @@ class Deckbuilding(commands.GroupCog, name="decks"):
 
         uid = str(interaction.user.id)
 
-        if uid not in self.game_data.users:
+        if not await self.game_data.user_exists(uid):
             self.game_data.add_user(uid)
             await interaction.followup.send(
                 "You don't own any cards yet, but your Durin TCG account has been created. Please use `/warp` or wait for `@axelotlramen` to implement this feature."
             )
             return
 
-        user = self.game_data.get_user(uid)
+        user = await self.game_data.fetch_user(uid)
 
         if not user.decks:
             await interaction.followup.send(
@@ -58,14 +58,14 @@ class Deckbuilding(commands.GroupCog, name="decks"):
     async def add_deck(self, interaction: discord.Interaction) -> None:
         uid = str(interaction.user.id)
 
-        if uid not in self.game_data.users:
+        if not await self.game_data.user_exists(uid):
             self.game_data.add_user(uid)
             await interaction.response.send_message(
                 "You don't own any cards yet, but your Durin TCG account has been created. Please use `/warp` to get some cards."
             )
             return
 
-        user = self.game_data.get_user(uid)
+        user = await self.game_data.fetch_user(uid)
 
         if len(user.decks) >= 10:
             await interaction.response.send_message("You already have the maximum of 10 decks.")
@@ -87,7 +87,7 @@ class Deckbuilding(commands.GroupCog, name="decks"):
     @app_commands.command(name="delete", description="Delete one of your decks.")
     async def delete_deck(self, interaction: discord.Interaction) -> None:
         uid = str(interaction.user.id)
-        user = self.game_data.get_user(uid)
+        user = await self.game_data.fetch_user(uid)
 
         if not user.decks:
             await interaction.response.send_message("You have no decks to delete.")
@@ -101,7 +101,7 @@ class Deckbuilding(commands.GroupCog, name="decks"):
     @app_commands.command(name="edit", description="Edit one of your existing decks.")
     async def edit_deck(self, interaction: discord.Interaction) -> None:
         uid = str(interaction.user.id)
-        user = self.game_data.get_user(uid)
+        user = await self.game_data.fetch_user(uid)
 
         if not user.decks:
             await interaction.response.send_message("You have no decks to edit.")
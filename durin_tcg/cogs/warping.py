@@ -33,8 +33,8 @@ class Warping(commands.GroupCog, name="warp"):
 
     async def _handle_warp(self, interaction: discord.Interaction, pulls: int) -> None:
         await interaction.response.defer()
-        users = self.game_data.users
         uid = str(interaction.user.id)
+        user = await self.game_data.fetch_user(uid)
 
         results = []
         for _ in range(pulls):
@@ -47,7 +47,7 @@ class Warping(commands.GroupCog, name="warp"):
             else:
                 card_names = list(self.game_data.cards.keys())
                 card = random.choice(card_names)
-                already_owned = card in users[uid].owned_cards
+                already_owned = card in user.owned_cards
                 self.game_data.add_card(uid, card)
                 results.append(
                     f"✨ New card: **{card}**"
@@ -55,8 +55,6 @@ class Warping(commands.GroupCog, name="warp"):
                     else f"📦 Duplicate card: **{card}**"
                 )
 
-        self.game_data.save_users()
-
         embed = discord.Embed(
             title=f"{interaction.user.display_name}'s Warp Results",
             description="\n".join(results),
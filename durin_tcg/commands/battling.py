@@ -10,6 +10,7 @@ from durin_tcg.views.battling.battle_views import AIBattleView, BattleView, Play
 
 if TYPE_CHECKING:
     from durin_tcg.models.game_data import GameData
+    from durin_tcg.utils.ai_move_service import AIMoveService
 
 
 class BattleCommand:
@@ -18,10 +19,12 @@ class BattleCommand:
         challenger: discord.User | discord.Member,
         opponent: discord.User | Literal["AI"],
         game_data: GameData,
+        ai_moves: AIMoveService,
     ) -> None:
         self.challenger = challenger
         self.opponent = opponent
         self.game_data = game_data
+        self.ai_moves = ai_moves
 
     async def send_invite(self, interaction: discord.Interaction) -> None:
         view = BattleInviteView(user=self.challenger, battle_command=self)
@@ -33,7 +36,7 @@ class BattleCommand:
             raise TypeError(msg)
         player1 = self._get_player(self.challenger)
         player2 = self._get_player(self.opponent)
-        battle = Battle(player1, player2)
+        battle = Battle(player1, player2, log=self.game_data.battle_log)
         return PlayerBattleView(
             challenger=self.challenger,
             opponent=self.opponent,
@@ -47,13 +50,16 @@ class BattleCommand:
             raise TypeError(msg)
         player1 = self._get_player(self.challenger)
         player2 = self._generate_ai_player()
-        battle = Battle(player1, player2)
-        return AIBattleView(challenger=self.challenger, game=battle, game_data=self.game_data)
+        battle = Battle(player1, player2, log=self.game_data.battle_log)
+        return AIBattleView(
+            challenger=self.challenger,
+            game=battle,
+            game_data=self.game_data,
+            ai_moves=self.ai_moves,
+        )
 
     def switch_deck(self, user: discord.User | discord.Member, new_deck_index: int) -> None:
-        user_data = self.game_data.get_user(str(user.id))
-        user_data.active_deck_index = new_deck_index
-        self.game_data.save_users()
+        self.game_data.set_active_deck(str(user.id), new_deck_index)
 
     def _get_player(self, user: discord.User | discord.Member) -> Player:
         user_data = self.game_data.get_user(str(user.id))
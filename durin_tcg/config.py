@@ -20,7 +20,17 @@ class Config(BaseSettings):
 
     # file routes
     user_data_file: str
+    user_db_file: str = "user_data.db"
     card_root: str
+    card_catalog_file: str = "card_catalog.json"
+    card_load_workers: int = 0
+    battle_log_file: str = "battle_log.jsonl"
+
+    # AI opponent search budget per move
+    ai_move_time: float = 1.0
+    ai_node_budget: int = 200_000
+    ai_workers: int = 2
+    ai_max_pending: int = 32
 
     env: EnvType = "dev"
 
@@ -1,15 +1,39 @@
 from __future__ import annotations
 
-from durin_tcg.enums import CardDamageType, CardElement
+from durin_tcg.enums import CardDamageType, CardElement, CardReaction
 
 EMBED_TIMEOUT = 60
 TURN_TIME_LIMIT = 15
 
+USER_FLUSH_INTERVAL = 5.0
+USER_FLUSH_BATCH_SIZE = 100
+USER_JOURNAL_COMPACT_SIZE = 1000
+USER_CACHE_SIZE = 10_000
+
 CARD_BASE_HP = 10
 CARD_BASIC_ATTACK = 1
 CARD_SKILL_ATTACK = 3
 CARD_ULTIMATE_ATTACK = 4
 
+# Action points: abilities and voluntary switches cost them, and a player regains some at the
+# start of each of their turns
+STARTING_ACTION_POINTS = 5
+MAX_ACTION_POINTS = 10
+ACTION_POINTS_PER_TURN = 1
+CARD_BASIC_COST = 0
+CARD_SKILL_COST = 1
+CARD_ULTIMATE_COST = 3
+SWITCH_COST = 1
+
+# Discord's message rate limit for one channel, which outbound requests are paced to
+CHANNEL_RATE_LIMIT = 5
+CHANNEL_RATE_PERIOD = 5.0
+
+# Battles still going after this many turns end in a draw
+BATTLE_TURN_LIMIT = 200
+# Extra time an AI worker gets on top of its search budget before the move times out
+AI_MOVE_TIMEOUT_GRACE = 2.0
+
 CARD_ELEMENT_TO_DAMAGE_TYPE = {
     # Genshin elements
     CardElement.GI_PYRO: CardDamageType.FIRE,
@@ -34,3 +58,29 @@ CARD_ELEMENT_TO_DAMAGE_TYPE = {
     CardElement.ZZZ_ICE: CardDamageType.ICE,
     CardElement.ZZZ_PHYSICAL: CardDamageType.PHYSICAL,
 }
+
+# One bit per damage type, for element flags stored as an int mask
+DAMAGE_TYPE_BITS = {damage_type: 1 << index for index, damage_type in enumerate(CardDamageType)}
+
+# Damage types that react with auras but never leave one themselves
+NON_AURA_DAMAGE_TYPES = frozenset(
+    {CardDamageType.AIR, CardDamageType.AURA, CardDamageType.PHYSICAL}
+)
+
+# Hitting a character with either damage type while it has the other as an aura consumes that
+# aura and deals the extra damage
+ELEMENTAL_REACTIONS = {
+    (CardDamageType.FIRE, CardDamageType.WATER): (CardReaction.VAPORIZE, 2),
+    (CardDamageType.FIRE, CardDamageType.ICE): (CardReaction.MELT, 2),
+    (CardDamageType.FIRE, CardDamageType.ELECTRICITY): (CardReaction.OVERLOADED, 2),
+    (CardDamageType.FIRE, CardDamageType.PLANT): (CardReaction.BURNING, 1),
+    (CardDamageType.ICE, CardDamageType.ELECTRICITY): (CardReaction.SUPERCONDUCT, 1),
+    (CardDamageType.WATER, CardDamageType.ELECTRICITY): (CardReaction.ELECTRO_CHARGED, 1),
+    (CardDamageType.WATER, CardDamageType.ICE): (CardReaction.FROZEN, 1),
+    (CardDamageType.WATER, CardDamageType.PLANT): (CardReaction.BLOOM, 1),
+    (CardDamageType.ELECTRICITY, CardDamageType.PLANT): (CardReaction.QUICKEN, 1),
+    (CardDamageType.AIR, CardDamageType.FIRE): (CardReaction.SWIRL, 1),
+    (CardDamageType.AIR, CardDamageType.WATER): (CardReaction.SWIRL, 1),
+    (CardDamageType.AIR, CardDamageType.ICE): (CardReaction.SWIRL, 1),
+    (CardDamageType.AIR, CardDamageType.ELECTRICITY): (CardReaction.SWIRL, 1),
+}
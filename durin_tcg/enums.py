@@ -51,3 +51,26 @@ class CardDamageType(StrEnum):
     PLANT = "Plant"
     AURA = "Aura"
     PHYSICAL = "Physical"
+
+
+class CardReaction(StrEnum):
+    VAPORIZE = "Vaporize"
+    MELT = "Melt"
+    OVERLOADED = "Overloaded"
+    SUPERCONDUCT = "Superconduct"
+    ELECTRO_CHARGED = "Electro-Charged"
+    FROZEN = "Frozen"
+    BURNING = "Burning"
+    BLOOM = "Bloom"
+    QUICKEN = "Quicken"
+    SWIRL = "Swirl"
+
+
+class UserChange(StrEnum):
+    CREATE = "create"
+    REPLACE = "replace"
+    CURRENCY = "currency"
+    CARD = "card"
+    DECK_SET = "deck_set"
+    DECK_DELETE = "deck_delete"
+    ACTIVE_DECK = "active_deck"
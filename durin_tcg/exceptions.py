@@ -3,3 +3,15 @@ from __future__ import annotations
 
 class InvalidAbilityUseError(Exception):
     """Raised when an ability is used in an invalid context (e.g. all enemies are dead)."""
+
+
+class IllegalActionError(Exception):
+    """Raised when a battle action isn't allowed right now (e.g. not enough action points)."""
+
+
+class AIServiceBusyError(Exception):
+    """Raised when too many AI moves are already waiting for a worker."""
+
+
+class ReplayDivergenceError(Exception):
+    """Raised when replaying a logged battle produces different events than were recorded."""
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from durin_tcg.models.battle_state import SWITCH_ACTION
+
+if TYPE_CHECKING:
+    from durin_tcg.models.battle_state import BattleState
+
+WIN_SCORE = 10_000.0
+# What an action point is worth in HP when evaluating a state
+ACTION_POINT_VALUE = 0.5
+# How many nodes to expand between deadline checks
+_CLOCK_INTERVAL = 256
+
+
+class _OutOfBudgetError(Exception):
+    pass
+
+
+@dataclass(slots=True)
+class SearchResult:
+    action: int
+    value: float
+    depth: int  # deepest fully searched depth, in plies
+    nodes: int
+    elapsed: float
+
+    @property
+    def nodes_per_second(self) -> float:
+        return self.nodes / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def evaluate(state: BattleState, player: int) -> float:
+    """Heuristic value of a non-final state for ``player``: team health and action points."""
+    enemy = 1 - player
+    return (
+        state.team_health(player)
+        - state.team_health(enemy)
+        + ACTION_POINT_VALUE * (state.action_points(player) - state.action_points(enemy))
+    )
+
+
+class _Search:
+    """Depth-limited expectimax where the opponent is a chance node over its legal actions."""
+
+    def __init__(self, state: BattleState, deadline: float, node_budget: int) -> None:
+        self.state = state
+        self.player = state.to_move
+        self.deadline = deadline
+        self.node_budget = node_budget
+        self.nodes = 0
+        self.cut_off = False
+
+    def value(self, depth: int) -> float:
+        self.nodes += 1
+        if self.nodes >= self.node_budget or (
+            self.nodes % _CLOCK_INTERVAL == 0 and time.perf_counter() >= self.deadline
+        ):
+            raise _OutOfBudgetError
+
+        state = self.state
+        if state.is_over:
+            winner = state.winner
+            if winner is None:
+                return 0.0
+            # Prefer quick wins and slow losses
+            score = WIN_SCORE - state.turns_played
+            return score if winner == self.player else -score
+        if depth == 0:
+            self.cut_off = True
+            return evaluate(state, self.player)
+
+        values = []
+        for action in state.legal_actions():
+            undo = state.apply(action)
+            values.append(self.value(depth - 1))
+            state.undo(undo)
+
+        if state.to_move == self.player:
+            return max(values)
+        return sum(values) / len(values)
+
+    def root(self, depth: int) -> tuple[int, float]:
+        state = self.state
+        best_action, best_value = -1, -float("inf")
+        for action in state.legal_actions():
+            undo = state.apply(action)
+            value = self.value(depth - 1)
+            state.undo(undo)
+            if value > best_value:
+                best_action, best_value = action, value
+        return best_action, best_value
+
+
+def search(
+    state: BattleState, *, time_limit: float, node_budget: int, max_depth: int = 64
+) -> SearchResult:
+    """Find the best action for the player to move in ``state``.
+
+    Searches with iterative deepening until the tree is exhausted or the time or node budget
+    runs out, and returns the best action of the deepest completed iteration. ``state`` is
+    not modified.
+    """
+    start = time.perf_counter()
+    # The search runs on a clone, so a search abandoned half way can leave it as it is
+    searcher = _Search(state.clone(), start + time_limit, node_budget)
+
+    # A one ply search is cheap and guarantees an answer even with a tiny budget
+    searcher.node_budget = max(node_budget, len(state.legal_actions()) + 1)
+    action, value = searcher.root(1)
+    searcher.node_budget = node_budget
+    depth = 1
+
+    while searcher.cut_off and depth < max_depth:
+        searcher.cut_off = False
+        try:
+            action, value = searcher.root(depth + 1)
+        except _OutOfBudgetError:
+            break
+        depth += 1
+
+    return SearchResult(action, value, depth, searcher.nodes, time.perf_counter() - start)
+
+
+def choose_turn(
+    state: BattleState, *, time_limit: float, node_budget: int
+) -> tuple[int | None, int, SearchResult]:
+    """Search for the deck index to switch to, if any, and the ability action for this turn.
+
+    This includes the switch a player with a knocked out active character has to make first.
+    Switching doesn't end the turn, so after choosing a switch the rest of the budget is spent
+    on the ability. The returned result totals both searches. ``state`` is not modified.
+    """
+    result = search(state, time_limit=time_limit, node_budget=node_budget)
+    if result.action < SWITCH_ACTION:
+        return None, result.action, result
+
+    state = state.clone()
+    state.apply(result.action)
+    follow_up = search(
+        state,
+        time_limit=max(time_limit - result.elapsed, 0),
+        node_budget=max(node_budget - result.nodes, 0),
+    )
+    total = SearchResult(
+        follow_up.action,
+        follow_up.value,
+        follow_up.depth,
+        result.nodes + follow_up.nodes,
+        result.elapsed + follow_up.elapsed,
+    )
+    return result.action - SWITCH_ACTION, follow_up.action, total
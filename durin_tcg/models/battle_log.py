@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import json
+import pathlib
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, NamedTuple, TextIO
+
+from durin_tcg.exceptions import ReplayDivergenceError
+from durin_tcg.models.battle_state import SWITCH_ACTION, BattleState, ability_stats
+from durin_tcg.models.card_registry import CARD_REGISTRY
+
+if TYPE_CHECKING:
+    from durin_tcg.models.cards import Card
+    from durin_tcg.models.game import Battle
+
+# 2: hits react with the target's auras
+# 3: action points and whole team battles, the header has action points
+LOG_VERSION = 3
+
+
+class BattleEvent(NamedTuple):
+    """One action and its effect; logged as a plain JSON array in this field order."""
+
+    turn: int
+    actor: int  # 0 for player 1, 1 for player 2
+    action: int  # a BattleState action
+    target: int  # deck index of the character hit, or switched to
+    damage: int  # HP the target lost
+    shield: int  # shield the target lost
+    elements: int  # DAMAGE_TYPE_BITS of the hit's element
+
+
+def battle_event(before: BattleState, action: int, after: BattleState) -> BattleEvent:
+    """Describe what ``action`` did, given the states before and after it."""
+    actor = before.to_move
+    if action >= SWITCH_ACTION:
+        return BattleEvent(before.turns_played, actor, action, action - SWITCH_ACTION, 0, 0, 0)
+
+    enemy = 1 - actor
+    target = before.active(enemy)
+    hp, shield, _ = before.character(enemy, target)
+    hp_after, shield_after, _ = after.character(enemy, target)
+    element = before.abilities[actor][before.active(actor)][action][1]
+    return BattleEvent(
+        before.turns_played, actor, action, target, hp - hp_after, shield - shield_after, element
+    )
+
+
+class BattleLogWriter:
+    """Appends battle records to a JSON lines file as they happen.
+
+    A battle starts with a header line holding its id, seed, decks and starting state; every
+    action then adds one short line with the battle id and its event. Lines from concurrent
+    battles may interleave. Writes are buffered and flushed when a battle ends.
+    """
+
+    def __init__(self, path: str | pathlib.Path) -> None:
+        self.path = pathlib.Path(path)
+        self._file: TextIO | None = None
+
+    def _write(self, record: dict[str, Any]) -> None:
+        if self._file is None:
+            self._file = self.path.open("a", encoding="utf-8")
+        self._file.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def start(self, battle: Battle) -> None:
+        self._write(
+            {
+                "v": LOG_VERSION,
+                "battle": battle.battle_id,
+                "seed": battle.seed,
+                "decks": [
+                    [char.card.name for char in player.deck]
+                    for player in (battle.player1, battle.player2)
+                ],
+                "state": BattleState.from_battle(battle).data.tolist(),
+            }
+        )
+
+    def event(self, battle: Battle, event: BattleEvent) -> None:
+        self._write({"battle": battle.battle_id, "e": event})
+
+    def flush(self) -> None:
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+@dataclass(slots=True)
+class BattleRecord:
+    battle_id: str
+    seed: int
+    decks: list[list[str]]
+    start: list[int]
+    events: list[BattleEvent] = field(default_factory=list)
+
+    def initial_state(self, cards: dict[str, Card]) -> BattleState:
+        card_ids = tuple(
+            tuple(CARD_REGISTRY.register(name) for name in deck) for deck in self.decks
+        )
+        abilities = tuple(tuple(ability_stats(cards[name]) for name in deck) for deck in self.decks)
+        return BattleState(array("i", self.start), card_ids, abilities)
+
+
+def read_battle_log(path: str | pathlib.Path) -> dict[str, BattleRecord]:
+    records: dict[str, BattleRecord] = {}
+    with pathlib.Path(path).open(encoding="utf-8") as file:
+        for line in file:
+            record = json.loads(line)
+            if "e" in record:
+                records[record["battle"]].events.append(BattleEvent(*record["e"]))
+            else:
+                records[record["battle"]] = BattleRecord(
+                    record["battle"], record["seed"], record["decks"], record["state"]
+                )
+    return records
+
+
+def replay(record: BattleRecord, cards: dict[str, Card], *, turn: int | None = None) -> BattleState:
+    """Rebuild a logged battle's state at the start of ``turn``, or at its end if None.
+
+    Every event is re-applied with the current engine and checked against the recorded one,
+    so a battle played on an older engine raises ReplayDivergenceError where they disagree.
+    """
+    state = record.initial_state(cards)
+    for recorded in record.events:
+        if turn is not None and recorded.turn >= turn:
+            break
+
+        before = state.clone()
+        state.apply(recorded.action)
+        event = battle_event(before, recorded.action, state)
+        if event != recorded:
+            msg = f"Battle {record.battle_id} diverged: recorded {recorded}, replayed {event}"
+            raise ReplayDivergenceError(msg)
+    return state
@@ -0,0 +1,342 @@
+from __future__ import annotations
+
+from array import array
+from typing import TYPE_CHECKING
+
+from durin_tcg.constants import (
+    ACTION_POINTS_PER_TURN,
+    BATTLE_TURN_LIMIT,
+    DAMAGE_TYPE_BITS,
+    MAX_ACTION_POINTS,
+    SWITCH_COST,
+)
+from durin_tcg.enums import CardAbility
+from durin_tcg.exceptions import IllegalActionError
+from durin_tcg.models.card_registry import CARD_REGISTRY
+from durin_tcg.models.damage import Hit, run_pipeline
+
+if TYPE_CHECKING:
+    from durin_tcg.models.cards import Card
+    from durin_tcg.models.game import Battle, Player
+
+# Actions are small ints: the three abilities, then "switch to deck index i" as SWITCH_ACTION + i
+ACTION_BASIC = 0
+ACTION_SKILL = 1
+ACTION_ULTIMATE = 2
+SWITCH_ACTION = 3
+ACTION_ABILITIES = (CardAbility.BASIC, CardAbility.SKILL, CardAbility.ULTIMATE)
+
+# Header fields of BattleState.data
+TURN = 0  # 0 when player 1 is to move, 1 for player 2
+TURNS_PLAYED = 1
+SWITCHED = 2  # whether the player to move already switched this turn
+ACTIVE = 3  # ACTIVE + player is that player's active deck index
+ACTION_POINTS = 5  # ACTION_POINTS + player is that player's action points
+HEADER_SIZE = 7
+
+# Each character is CHARACTER_SIZE consecutive fields after the header
+HP = 0
+SHIELD = 1
+ELEMENTS = 2  # the character's aura mask, see Character.auras
+CHARACTER_SIZE = 3
+
+type AbilityStats = tuple[int, int, int]  # damage, DAMAGE_TYPE_BITS of the damage type, cost
+type Undo = list[tuple[int, int]]  # (field, previous value) pairs
+type CardTables = tuple[
+    tuple[tuple[int, ...], ...],  # card registry ids, by player and deck index
+    tuple[tuple[tuple[AbilityStats, ...], ...], ...],  # ability stats, likewise
+]
+
+
+def ability_stats(card: Card) -> tuple[AbilityStats, ...]:
+    """Damage, element bit and action point cost of a card's abilities, indexed by action.
+
+    Buff abilities are not implemented yet, so they deal no damage and apply no element.
+    """
+    return tuple(
+        (ability.damage_number, DAMAGE_TYPE_BITS[ability.damage_type], ability.cost)
+        if ability.ability_type == "attack"
+        else (0, 0, ability.cost)
+        for ability in card.abilities
+    )
+
+
+def action_for(ability: CardAbility) -> int:
+    return ACTION_ABILITIES.index(ability)
+
+
+class BattleState:
+    """A battle reduced to a flat int array plus immutable per-card tables.
+
+    The array holds whose turn it is, the active indexes, action points and every character's
+    HP, shield and auras; cards are referenced by registry id and their abilities by
+    precomputed stats. The tables are shared between clones, so cloning copies a few dozen
+    ints, and ``apply`` returns an undo log for searching in place instead.
+
+    These are the battle rules that Battle.step, the AI search and the simulator share. On
+    their turn a player may switch their active character once, for SWITCH_COST action points,
+    and then uses one ability they can pay for, which ends the turn. A player whose active
+    character was knocked out must first switch to another one, for free. A player wins when
+    every character of the other team is knocked out, and the battle is a draw once
+    BATTLE_TURN_LIMIT turns were played.
+    """
+
+    __slots__ = ("abilities", "bases", "card_ids", "data")
+
+    def __init__(
+        self,
+        data: array[int],
+        card_ids: tuple[tuple[int, ...], ...],
+        abilities: tuple[tuple[tuple[AbilityStats, ...], ...], ...],
+    ) -> None:
+        self.data = data
+        self.card_ids = card_ids
+        self.abilities = abilities
+        self.bases = (HEADER_SIZE, HEADER_SIZE + CHARACTER_SIZE * len(card_ids[0]))
+
+    @staticmethod
+    def card_tables(players: tuple[Player, Player]) -> CardTables:
+        """Registry ids and ability stats of both decks, which don't change during a battle."""
+        card_ids = tuple(
+            tuple(CARD_REGISTRY.register(char.card.name) for char in player.deck)
+            for player in players
+        )
+        abilities = tuple(
+            tuple(ability_stats(char.card) for char in player.deck) for player in players
+        )
+        return card_ids, abilities
+
+    @classmethod
+    def from_battle(cls, battle: Battle) -> BattleState:
+        players = (battle.player1, battle.player2)
+        data = array("i", [0] * HEADER_SIZE)
+        data[TURN] = 0 if battle.player1_turn else 1
+        data[TURNS_PLAYED] = battle.turns_played
+        data[SWITCHED] = battle.switched
+
+        for index, player in enumerate(players):
+            data[ACTIVE + index] = player.deck.index(player.active_character)
+            data[ACTION_POINTS + index] = player.action_points
+            for char in player.deck:
+                data.extend((char.current_hp, char.current_shield, char.auras))
+
+        return cls(data, *battle.card_tables)
+
+    def apply_to(self, battle: Battle) -> None:
+        """Write this state back into ``battle``'s characters and players."""
+        data = self.data
+        for index, player in enumerate((battle.player1, battle.player2)):
+            base = self.bases[index]
+            for char in player.deck:
+                char.current_hp = data[base + HP]
+                char.current_shield = data[base + SHIELD]
+                char.auras = data[base + ELEMENTS]
+                base += CHARACTER_SIZE
+            player.active_character = player.deck[data[ACTIVE + index]]
+            player.action_points = data[ACTION_POINTS + index]
+        battle.player1_turn = data[TURN] == 0
+        battle.turns_played = data[TURNS_PLAYED]
+        battle.switched = bool(data[SWITCHED])
+
+    def clone(self) -> BattleState:
+        state = object.__new__(BattleState)
+        state.data = self.data[:]
+        state.card_ids = self.card_ids
+        state.abilities = self.abilities
+        state.bases = self.bases
+        return state
+
+    @property
+    def to_move(self) -> int:
+        return self.data[TURN]
+
+    @property
+    def turns_played(self) -> int:
+        return self.data[TURNS_PLAYED]
+
+    def active(self, player: int) -> int:
+        return self.data[ACTIVE + player]
+
+    def action_points(self, player: int) -> int:
+        return self.data[ACTION_POINTS + player]
+
+    def character(self, player: int, index: int) -> tuple[int, int, int]:
+        """HP, shield and aura mask of a player's character."""
+        base = self.bases[player] + CHARACTER_SIZE * index
+        return self.data[base + HP], self.data[base + SHIELD], self.data[base + ELEMENTS]
+
+    def card_name(self, player: int, index: int) -> str:
+        return CARD_REGISTRY.name_of(self.card_ids[player][index])
+
+    def team_health(self, player: int) -> int:
+        """Total HP and shield of a player's characters."""
+        base = self.bases[player]
+        end = base + CHARACTER_SIZE * len(self.card_ids[player])
+        return sum(self.data[base + HP : end : CHARACTER_SIZE]) + sum(
+            self.data[base + SHIELD : end : CHARACTER_SIZE]
+        )
+
+    def knocked_out(self, player: int) -> bool:
+        """Whether the player's active character is knocked out, so they must switch."""
+        data = self.data
+        return data[self.bases[player] + CHARACTER_SIZE * data[ACTIVE + player] + HP] <= 0
+
+    @property
+    def winner(self) -> int | None:
+        """The player who knocked out the other's whole team, if any."""
+        data = self.data
+        for enemy in (0, 1):
+            base = self.bases[enemy]
+            end = base + CHARACTER_SIZE * len(self.card_ids[enemy])
+            if max(data[base + HP : end : CHARACTER_SIZE]) <= 0:
+                return 1 - enemy
+        return None
+
+    @property
+    def is_over(self) -> bool:
+        return self.data[TURNS_PLAYED] >= BATTLE_TURN_LIMIT or self.winner is not None
+
+    def legal_actions(self) -> list[int]:
+        if self.is_over:
+            return []
+
+        data = self.data
+        player = data[TURN]
+        active = data[ACTIVE + player]
+        base = self.bases[player]
+        switches = [
+            SWITCH_ACTION + index
+            for index in range(len(self.card_ids[player]))
+            if index != active and data[base + CHARACTER_SIZE * index + HP] > 0
+        ]
+        if data[base + CHARACTER_SIZE * active + HP] <= 0:
+            return switches
+
+        points = data[ACTION_POINTS + player]
+        actions = [
+            action
+            for action, (_, _, cost) in enumerate(self.abilities[player][active])
+            if cost <= points
+        ]
+        if not data[SWITCHED] and points >= SWITCH_COST:
+            actions.extend(switches)
+        return actions
+
+    def illegal_reason(self, action: int) -> str:
+        """Why ``action`` isn't one of the legal actions, for showing to players."""
+        if self.is_over:
+            return "The battle is over."
+
+        player = self.to_move
+        if action >= SWITCH_ACTION:
+            index = action - SWITCH_ACTION
+            if not 0 <= index < len(self.card_ids[player]):
+                return "There is no such character."
+            if index == self.active(player):
+                return "That character is already active."
+            if self.character(player, index)[0] <= 0:
+                return "That character has been knocked out."
+            if self.data[SWITCHED]:
+                return "You already switched characters this turn."
+            return (
+                f"Not enough action points to switch: it costs {SWITCH_COST}, "
+                f"you have {self.action_points(player)}."
+            )
+
+        if self.knocked_out(player):
+            return "Your active character has been knocked out, switch to another one first."
+        if not 0 <= action < SWITCH_ACTION:
+            return "There is no such ability."
+        cost = self.abilities[player][self.active(player)][action][2]
+        return (
+            f"Not enough action points for that ability: it costs {cost}, "
+            f"you have {self.action_points(player)}."
+        )
+
+    def apply(self, action: int, players: tuple[Player, Player] | None = None) -> Undo:
+        """Play a legal ``action`` for the player to move and return the log that undoes it.
+
+        Attacks go through DAMAGE_PIPELINE. Given ``players``, the players this state was read
+        from, the ability's add_func hook runs on them as one of its stages, and the characters
+        it changed are read back; the undo log doesn't cover those changes.
+        """
+        data = self.data
+        player = data[TURN]
+
+        if action >= SWITCH_ACTION:
+            changes = [
+                (ACTIVE + player, data[ACTIVE + player]),
+                (SWITCHED, data[SWITCHED]),
+                (ACTION_POINTS + player, data[ACTION_POINTS + player]),
+            ]
+            # Replacing a knocked out character is free
+            if not self.knocked_out(player):
+                data[ACTION_POINTS + player] -= SWITCH_COST
+            data[ACTIVE + player] = action - SWITCH_ACTION
+            data[SWITCHED] = 1
+            return changes
+
+        damage, element, cost = self.abilities[player][data[ACTIVE + player]][action]
+        enemy = 1 - player
+        base = self.bases[enemy] + CHARACTER_SIZE * data[ACTIVE + enemy]
+        hit = Hit(data[base + HP], data[base + SHIELD], data[base + ELEMENTS], damage, element)
+        changes = [
+            (base + HP, hit.hp),
+            (base + SHIELD, hit.shield),
+            (base + ELEMENTS, hit.auras),
+            (ACTION_POINTS + player, data[ACTION_POINTS + player]),
+            (ACTION_POINTS + enemy, data[ACTION_POINTS + enemy]),
+            (TURN, player),
+            (TURNS_PLAYED, data[TURNS_PLAYED]),
+            (SWITCHED, data[SWITCHED]),
+        ]
+
+        if players is not None:
+            hit.allies, hit.enemy = players[player].deck, players[enemy]
+            hit.add_func = players[player].active_character.card.abilities[action].add_func
+        run_pipeline(hit)
+        data[base + HP], data[base + SHIELD], data[base + ELEMENTS] = hit.hp, hit.shield, hit.auras
+        if hit.add_func is not None and players is not None:
+            self._read_characters(players, skip=base)
+
+        data[ACTION_POINTS + player] -= cost
+        data[ACTION_POINTS + enemy] = min(
+            data[ACTION_POINTS + enemy] + ACTION_POINTS_PER_TURN, MAX_ACTION_POINTS
+        )
+        data[TURN] = enemy
+        data[TURNS_PLAYED] += 1
+        data[SWITCHED] = 0
+        return changes
+
+    def _read_characters(self, players: tuple[Player, Player], skip: int) -> None:
+        """Read the characters of ``players`` back into the state, except the one at ``skip``."""
+        data = self.data
+        for index, player in enumerate(players):
+            base = self.bases[index]
+            for char in player.deck:
+                if base != skip:
+                    data[base + HP] = char.current_hp
+                    data[base + SHIELD] = char.current_shield
+                    data[base + ELEMENTS] = char.auras
+                base += CHARACTER_SIZE
+
+    def undo(self, changes: Undo) -> None:
+        data = self.data
+        for field, value in reversed(changes):
+            data[field] = value
+
+
+def step(
+    state: BattleState, action: int, players: tuple[Player, Player] | None = None
+) -> BattleState:
+    """The state after the player to move plays ``action``; ``state`` is left unchanged.
+
+    Raises IllegalActionError if the action isn't legal. ``players`` are passed on to
+    ``apply``. Searches that already know their actions are legal use ``apply`` and ``undo``
+    on one state instead.
+    """
+    if action not in state.legal_actions():
+        raise IllegalActionError(state.illegal_reason(action))
+    state = state.clone()
+    state.apply(action, players)
+    return state
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Any
+
+from pydantic_core import core_schema
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    from pydantic import GetCoreSchemaHandler
+
+
+class CardRegistry:
+    """Assigns every card name a small integer id that stays stable across restarts.
+
+    Ids are persisted by the user store; new ones are handed out in registration order.
+    """
+
+    def __init__(self) -> None:
+        self._names: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._unsaved: list[tuple[int, str]] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def load(self, pairs: Iterable[tuple[int, str]]) -> None:
+        """Restore previously persisted ids; ids that are already loaded must match."""
+        with self._lock:
+            for card_id, name in sorted(pairs):
+                if card_id < len(self._names) and self._names[card_id] == name:
+                    continue
+                if card_id != len(self._names) or name in self._ids:
+                    msg = f"Persisted card id {card_id} ({name!r}) conflicts with the registry"
+                    raise ValueError(msg)
+                self._names.append(name)
+                self._ids[name] = card_id
+
+    def register(self, name: str) -> int:
+        card_id = self._ids.get(name)
+        if card_id is not None:
+            return card_id
+
+        with self._lock:
+            card_id = self._ids.get(name)
+            if card_id is None:
+                card_id = len(self._names)
+                self._names.append(name)
+                self._ids[name] = card_id
+                self._unsaved.append((card_id, name))
+        return card_id
+
+    def id_of(self, name: str) -> int | None:
+        return self._ids.get(name)
+
+    def name_of(self, card_id: int) -> str:
+        return self._names[card_id]
+
+    def canonical(self, name: str) -> str:
+        """Return the registry's own copy of a name, so equal names share one string object."""
+        return self._names[self.register(name)]
+
+    def unsaved(self) -> list[tuple[int, str]]:
+        with self._lock:
+            return list(self._unsaved)
+
+    def mark_saved(self, count: int) -> None:
+        with self._lock:
+            del self._unsaved[:count]
+
+
+class CardSet:
+    """A set of card names stored as a bitset of registry ids.
+
+    Membership, insertion and set operations are bit operations on a single int; iterating
+    yields card names in id order.
+    """
+
+    __slots__ = ("bits",)
+
+    def __init__(self, names: Iterable[str] = (), *, bits: int = 0) -> None:
+        for name in names:
+            bits |= 1 << CARD_REGISTRY.register(name)
+        self.bits = bits
+
+    def __contains__(self, name: object) -> bool:
+        card_id = CARD_REGISTRY.id_of(name) if isinstance(name, str) else None
+        return card_id is not None and (self.bits >> card_id) & 1 == 1
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self.bits
+        while bits:
+            lowest = bits & -bits
+            yield CARD_REGISTRY.name_of(lowest.bit_length() - 1)
+            bits ^= lowest
+
+    def __len__(self) -> int:
+        return self.bits.bit_count()
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, CardSet) and other.bits == self.bits
+
+    def __hash__(self) -> int:
+        return hash(self.bits)
+
+    def __or__(self, other: CardSet) -> CardSet:
+        return CardSet(bits=self.bits | other.bits)
+
+    def __and__(self, other: CardSet) -> CardSet:
+        return CardSet(bits=self.bits & other.bits)
+
+    def __sub__(self, other: CardSet) -> CardSet:
+        return CardSet(bits=self.bits & ~other.bits)
+
+    def __repr__(self) -> str:
+        return f"CardSet({list(self)!r})"
+
+    def add(self, name: str) -> bool:
+        """Add a card and return whether it was new."""
+        bit = 1 << CARD_REGISTRY.register(name)
+        if self.bits & bit:
+            return False
+        self.bits |= bit
+        return True
+
+    @classmethod
+    def _validate(cls, value: Any) -> CardSet:
+        if isinstance(value, CardSet):
+            return value
+        if isinstance(value, list | tuple | set | frozenset) and all(
+            isinstance(name, str) for name in value
+        ):
+            return cls(value)
+        msg = "Expected a CardSet or a list of card names"
+        raise ValueError(msg)
+
+    @classmethod
+    def __get_pydantic_core_schema__(  # noqa: PLW3201
+        cls, _source: Any, _handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        # Serialized as a list of names, so dumps stay readable and independent of the ids
+        return core_schema.no_info_plain_validator_function(
+            cls._validate, serialization=core_schema.plain_serializer_function_ser_schema(list)
+        )
+
+
+# Singleton card registry instance
+CARD_REGISTRY = CardRegistry()
@@ -4,12 +4,17 @@ from typing import TYPE_CHECKING, Literal
 
 from durin_tcg.constants import (
     CARD_BASIC_ATTACK,
+    CARD_BASIC_COST,
     CARD_ELEMENT_TO_DAMAGE_TYPE,
     CARD_SKILL_ATTACK,
+    CARD_SKILL_COST,
     CARD_ULTIMATE_ATTACK,
+    CARD_ULTIMATE_COST,
+    DAMAGE_TYPE_BITS,
 )
 from durin_tcg.enums import CardDamageType, Game
 from durin_tcg.exceptions import InvalidAbilityUseError
+from durin_tcg.models.damage import Hit, run_pipeline
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -27,29 +32,38 @@ class Ability:
         damage_number: int,
         add_func: Callable[[list[Character], Player], None] | None = None,
         ability_type: Literal["attack", "buff"] = "attack",
+        cost: int = 0,
     ) -> None:
         self.name = name
         self.desc = desc
         self.damage_type = damage_type
         self.damage_number = damage_number
+        self.element_bit = DAMAGE_TYPE_BITS[damage_type]
+        self.cost = cost  # action points
 
         self.add_func = add_func
         self.ability_type = ability_type
 
-    def default_attack(self, _allies: list[Character], enemy: Player) -> None:
-        enemy_active = enemy.active_character
-        damage = self.damage_number
-        enemy_active.afflict_element(self.damage_type)
-
-        if enemy_active.current_shield > 0:
-            if damage <= enemy_active.current_shield:
-                enemy_active.current_shield -= damage
-                damage = 0
-            else:
-                damage -= enemy_active.current_shield
-                enemy_active.current_shield = 0
-
-        enemy_active.current_hp = max(enemy_active.current_hp - damage, 0)
+        # Dispatch is decided once here rather than on every use
+        self._handler = self.default_attack if ability_type == "attack" else self.default_buff
+
+    def default_attack(self, allies: list[Character], enemy: Player) -> None:
+        """Hit ``enemy``'s active character through DAMAGE_PIPELINE, the stages
+        BattleState.apply runs, without spending action points or ending a turn."""
+        target = enemy.active_character
+        hit = run_pipeline(
+            Hit(
+                target.current_hp,
+                target.current_shield,
+                target.auras,
+                self.damage_number,
+                self.element_bit,
+                self.add_func,
+                allies,
+                enemy,
+            )
+        )
+        target.current_hp, target.current_shield, target.auras = hit.hp, hit.shield, hit.auras
 
     def default_buff(self, allies: list[Character], _enemy: Player) -> None:
         live_allies = [a for a in allies if a.final_hp > 0]
@@ -61,10 +75,7 @@ class Ability:
         raise NotImplementedError(msg)
 
     def use(self, allies: list[Character], enemy: Player) -> None:
-        if self.ability_type == "attack":
-            self.default_attack(allies, enemy)
-        else:
-            self.default_buff(allies, enemy)
+        self._handler(allies, enemy)
 
 
 class Card:
@@ -82,20 +93,26 @@ class Card:
             desc=f"{self.name} strikes an enemy.",
             damage_type=card_damage_type,
             damage_number=CARD_BASIC_ATTACK,
+            cost=CARD_BASIC_COST,
         )
         self.skill = Ability(
             name=f"{self.name} Skill",
             desc=f"{self.name} uses their unique ability.",
             damage_type=card_damage_type,
             damage_number=CARD_SKILL_ATTACK,
+            cost=CARD_SKILL_COST,
         )
         self.ultimate = Ability(
             name=f"{self.name} Ultimate",
             desc=f"{self.name} unleashes a devastating ultimate attack.",
             damage_type=card_damage_type,
             damage_number=CARD_ULTIMATE_ATTACK,
+            cost=CARD_ULTIMATE_COST,
         )
 
+        # Indexed by BattleState action
+        self.abilities = (self.basic, self.skill, self.ultimate)
+
     def __repr__(self) -> str:
         return "**" + self.name + "* : " + self.desc
 
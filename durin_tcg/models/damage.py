@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from durin_tcg.models.reactions import REACTION_TABLE
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from durin_tcg.enums import CardReaction
+    from durin_tcg.models.game import Character, Player
+
+
+class Hit:
+    """One ability hitting the enemy's active character, passed through DAMAGE_PIPELINE.
+
+    The target's HP, shield and aura mask are ints, as BattleState stores them, and are
+    written back once every stage ran. ``add_func``, ``allies`` and ``enemy`` are only set when
+    the hit lands on the players themselves, as in Battle.step; searches leave them unset, so
+    hooks don't run there.
+    """
+
+    __slots__ = (
+        "add_func",
+        "allies",
+        "auras",
+        "damage",
+        "element",
+        "enemy",
+        "hp",
+        "reaction",
+        "shield",
+    )
+
+    def __init__(
+        self,
+        hp: int,
+        shield: int,
+        auras: int,
+        damage: int,
+        element: int,
+        add_func: Callable[[list[Character], Player], None] | None = None,
+        allies: list[Character] | None = None,
+        enemy: Player | None = None,
+    ) -> None:
+        self.hp = hp
+        self.shield = shield
+        self.auras = auras
+        self.damage = damage
+        self.element = element  # DAMAGE_TYPE_BITS of the damage type
+        self.reaction: CardReaction | None = None
+
+        self.add_func = add_func
+        self.allies = allies
+        self.enemy = enemy
+
+
+type Stage = Callable[[Hit], None]
+
+
+def apply_reaction(hit: Hit) -> None:
+    hit.auras, bonus, hit.reaction = REACTION_TABLE[hit.auras][hit.element]
+    hit.damage += bonus
+
+
+def absorb_shield(hit: Hit) -> None:
+    shield, damage = hit.shield, hit.damage
+    if shield >= damage:
+        hit.shield, hit.damage = shield - damage, 0
+    else:
+        hit.shield, hit.damage = 0, damage - shield
+
+
+def apply_damage(hit: Hit) -> None:
+    hit.hp = max(hit.hp - hit.damage, 0)
+
+
+def run_add_func(hit: Hit) -> None:
+    """Run the ability's add_func hook on the players, with the target as the stages before
+    this one left it."""
+    if hit.add_func is None or hit.allies is None or hit.enemy is None:
+        return
+
+    target = hit.enemy.active_character
+    target.current_hp, target.current_shield, target.auras = hit.hp, hit.shield, hit.auras
+    hit.add_func(hit.allies, hit.enemy)
+    hit.hp, hit.shield, hit.auras = target.current_hp, target.current_shield, target.auras
+
+
+# The stages every hit runs, in order; damage modifiers such as buffs go before absorb_shield.
+# Changing the list changes the rules of every battle, so do it in place, once, at startup.
+# BattleBatch hard-codes the default stages and must be kept equivalent to them.
+DAMAGE_PIPELINE: list[Stage] = [apply_reaction, absorb_shield, apply_damage, run_add_func]
+
+
+def run_pipeline(hit: Hit) -> Hit:
+    for stage in DAMAGE_PIPELINE:
+        stage(hit)
+    return hit
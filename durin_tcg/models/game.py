@@ -1,27 +1,45 @@
 from __future__ import annotations
 
 import random
+import uuid
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING
 
-from durin_tcg.constants import CARD_BASE_HP
-from durin_tcg.enums import CardAbility, CardDamageType, CardElement
+from durin_tcg.config import CONFIG
+from durin_tcg.constants import CARD_BASE_HP, DAMAGE_TYPE_BITS, STARTING_ACTION_POINTS
+from durin_tcg.models.ai_search import SearchResult, choose_turn
+from durin_tcg.models.battle_log import battle_event
+from durin_tcg.models.battle_state import ACTION_ABILITIES, SWITCH_ACTION, BattleState, action_for
+from durin_tcg.models.battle_state import step as step_state
+from durin_tcg.models.reactions import REACTION_TABLE, aura_types
 
 if TYPE_CHECKING:
+    from durin_tcg.enums import CardAbility, CardDamageType
+    from durin_tcg.models.battle_log import BattleEvent, BattleLogWriter
     from durin_tcg.models.cards import Card
+    from durin_tcg.models.reactions import Reaction
 
 
 class Character:
+    __slots__ = ("auras", "card", "current_hp", "current_shield", "final_hp")
+
     def __init__(self, card: Card, current_hp: int = CARD_BASE_HP) -> None:
         self.card = card
         self.current_hp = current_hp
         self.current_shield: int = 0
-        self.afflicted_elements: list[CardDamageType] = []
+        self.auras = 0  # DAMAGE_TYPE_BITS of the elements the character is afflicted with
 
         self.final_hp: int = self.current_hp + self.current_shield
 
-    def afflict_element(self, element: CardDamageType) -> None:
-        self.afflicted_elements.append(element)
+    @property
+    def afflicted_elements(self) -> list[CardDamageType]:
+        return aura_types(self.auras)
+
+    def afflict_element(self, element: CardDamageType) -> Reaction:
+        """Hit the character with ``element``, reacting with its auras; returns the outcome."""
+        reaction = REACTION_TABLE[self.auras][DAMAGE_TYPE_BITS[element]]
+        self.auras = reaction.auras
+        return reaction
 
 
 class Item(ABC):
@@ -35,12 +53,14 @@ class Item(ABC):
 
 
 class Player:
+    __slots__ = ("action_points", "active_character", "deck", "items")
+
     def __init__(
         self,
         deck: list[Character],
         active_character: Character,
         items: list[Item] | None = None,
-        action_points: int = 5,
+        action_points: int = STARTING_ACTION_POINTS,
     ) -> None:
         self.deck = deck
         self.active_character = active_character
@@ -52,57 +72,143 @@ class Player:
             self.active_character = self.deck[ally_id]
 
     def use_ability(self, ability: CardAbility, enemy: Player) -> None:
-        ability_method = {
-            CardAbility.BASIC: self.active_character.card.basic,
-            CardAbility.SKILL: self.active_character.card.skill,
-            CardAbility.ULTIMATE: self.active_character.card.ultimate,
-        }.get(ability)
-
-        if ability_method is None:
-            msg = f"Unknown ability type: {ability}"
-            raise ValueError(msg)
-
-        ability_method.use(allies=self.deck, enemy=enemy)
+        """Use the active character's ``ability`` on ``enemy`` outside of a battle's turns."""
+        self.active_character.card.abilities[action_for(ability)].use(self.deck, enemy)
 
 
 class AIPlayer(Player):
-    def choose_ability(self) -> CardAbility:
-        return random.choice([CardAbility.BASIC, CardAbility.SKILL, CardAbility.ULTIMATE])
+    __slots__ = ()
 
-    def choose_character_switch(self) -> int | None:
-        # TODO: implement logic to decide if and which character to switch to
-        return None
+    def choose_turn(
+        self,
+        battle: Battle,
+        *,
+        time_limit: float = CONFIG.ai_move_time,
+        node_budget: int = CONFIG.ai_node_budget,
+    ) -> tuple[int | None, CardAbility, SearchResult]:
+        """Search for the character to switch to, if any, and the ability to use this turn.
+
+        Blocks for up to ``time_limit`` seconds; the bot runs it through the AIMoveService
+        instead. ``battle`` is left unchanged.
+        """
+        switch, action, result = choose_turn(
+            BattleState.from_battle(battle), time_limit=time_limit, node_budget=node_budget
+        )
+        return switch, ACTION_ABILITIES[action], result
 
 
 class Battle:
-    def __init__(self, player1: Player, player2: Player) -> None:
+    __slots__ = (
+        "battle_id",
+        "card_tables",
+        "events",
+        "log",
+        "player1",
+        "player1_turn",
+        "player2",
+        "rng",
+        "seed",
+        "switched",
+        "turns_played",
+    )
+
+    def __init__(
+        self,
+        player1: Player,
+        player2: Player,
+        *,
+        seed: int | None = None,
+        log: BattleLogWriter | None = None,
+    ) -> None:
         self.player1 = player1
         self.player2 = player2
         self.player1_turn = True
+        self.turns_played = 0
+        self.switched = False  # whether the player to move already switched this turn
+        self.card_tables = BattleState.card_tables((player1, player2))
+
+        # Every random decision in a battle must come from self.rng so a seed reproduces it
+        self.seed = seed if seed is not None else random.getrandbits(63)
+        self.rng = random.Random(self.seed)
+        self.battle_id = uuid.uuid4().hex
+        self.events: list[BattleEvent] = []
+        self.log = log
+        if log is not None:
+            log.start(self)
+
+    @property
+    def winner(self) -> Player | None:
+        """The player who knocked out the other's whole team, if any."""
+        winner = BattleState.from_battle(self).winner
+        if winner is None:
+            return None
+        return self.player1 if winner == 0 else self.player2
+
+    @property
+    def is_over(self) -> bool:
+        return BattleState.from_battle(self).is_over
+
+    def legal_actions(self) -> list[int]:
+        return BattleState.from_battle(self).legal_actions()
+
+    def step(self, action: int) -> BattleEvent:
+        """Play a BattleState action for the player whose turn it is.
+
+        The rules are those of BattleState, with the ability's add_func hook run on the players
+        as a stage of the damage pipeline, and the result is written back into the players and
+        characters. Raises IllegalActionError if the action isn't legal. The resulting event
+        is kept in ``events`` and appended to the battle log, if there is one.
+        """
+        before = BattleState.from_battle(self)
+        after = step_state(before, action, (self.player1, self.player2))
+        after.apply_to(self)
+
+        event = battle_event(before, action, after)
+        self.events.append(event)
+        if self.log is not None:
+            self.log.event(self, event)
+            if after.is_over:
+                self.log.flush()
+        return event
 
     def play_game(self) -> str:
+        """Play the battle to the end with both players using their strongest affordable
+        ability every turn, and describe it."""
         log: list[str] = []
 
-        while (
-            self.player1.active_character.current_hp > 0
-            and self.player2.active_character.current_hp > 0
-        ):
-            attacker = self.player1 if self.player1_turn else self.player2
-            defender = self.player2 if self.player1_turn else self.player1
-
-            log.append(
-                f"{attacker.active_character.card.name} uses Basic Attack on {defender.active_character.card.name}!"
+        state = BattleState.from_battle(self)
+        while not state.is_over:
+            player = state.to_move
+            attacker, defender = (
+                (self.player1, self.player2) if player == 0 else (self.player2, self.player1)
             )
-            attacker.use_ability(CardAbility.ULTIMATE, defender)
-
-            # Check if defender is defeated
-            if defender.active_character.current_hp <= 0:
-                log.append(f"{defender.active_character.card.name} has been defeated!")
-                break
-
-            self.player1_turn = not self.player1_turn
-
-        winner = self.player1 if self.player1.active_character.current_hp > 0 else self.player2
-        log.append(f"🏆 {winner.active_character.card.name}'s team wins!")
+            actions = state.legal_actions()
+
+            if actions[0] >= SWITCH_ACTION:
+                # Knocked out, so the only legal actions are switches
+                self.step(actions[0])
+                log.append(f"{attacker.active_character.card.name} steps in!")
+            else:
+                abilities = state.abilities[player][state.active(player)]
+                action = max(
+                    (action for action in actions if action < SWITCH_ACTION),
+                    key=lambda action: abilities[action][0],
+                )
+                target = defender.active_character
+                self.step(action)
+                log.append(
+                    f"{attacker.active_character.card.name} uses "
+                    f"{attacker.active_character.card.abilities[action].name} on {target.card.name}!"
+                )
+                if target.current_hp <= 0:
+                    log.append(f"{target.card.name} has been defeated!")
+
+            state = BattleState.from_battle(self)
+
+        winner = self.winner
+        if winner is None:
+            log.append(f"The battle ended in a draw after {self.turns_played} turns.")
+        else:
+            log.append(f"🏆 {winner.active_character.card.name}'s team wins!")
 
         return "\n".join(log)
@@ -1,31 +1,266 @@
 from __future__ import annotations
 
+import asyncio
+import contextlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from durin_tcg.config import CONFIG
+from durin_tcg.constants import (
+    USER_CACHE_SIZE,
+    USER_FLUSH_BATCH_SIZE,
+    USER_FLUSH_INTERVAL,
+    USER_JOURNAL_COMPACT_SIZE,
+)
+from durin_tcg.enums import UserChange
+from durin_tcg.models.battle_log import BattleLogWriter
+from durin_tcg.models.card_registry import CARD_REGISTRY
 from durin_tcg.models.user import TCGUser
-from durin_tcg.utils.reading_cards import read_cards
-from durin_tcg.utils.reading_users import load_all_users, save_all_users
+from durin_tcg.utils.card_embeds import CardEmbedCache
+from durin_tcg.utils.logger import LOGGER
+from durin_tcg.utils.lru_cache import LRUCache
+from durin_tcg.utils.reading_cards import read_cards, reload_cards
+from durin_tcg.utils.user_store import UserStore
+
+if TYPE_CHECKING:
+    from durin_tcg.models.user import CardDeck
+    from durin_tcg.utils.user_store import Change
 
 
 class GameData:
     def __init__(self) -> None:
-        self.users = load_all_users()
+        self.store = UserStore()
+        self.store.migrate_from_json()
+        # Fold any journal entries left over from the last run into the snapshots; users
+        # themselves are only hydrated when they are first accessed.
+        self.store.compact()
         self.cards = read_cards()
+        self.card_embeds = CardEmbedCache(self.cards)
+        for name in sorted(self.cards):
+            CARD_REGISTRY.register(name)
+        self.store.save_card_ids()
+        self.battle_log = BattleLogWriter(CONFIG.battle_log_file)
+
+        self.users: LRUCache[str, TCGUser] = LRUCache(USER_CACHE_SIZE, on_evict=self._write_back)
+        self._dirty: set[str] = set()
+        self._flushing: set[str] = set()
+        # Evicted users whose snapshot write has not finished yet
+        self._evicted: dict[str, TCGUser] = {}
+
+        self._pending: list[Change] = []
+        self._flush_requested = asyncio.Event()
+        # A single worker runs store calls in submission order, so writes for the same user
+        # can never be reordered, and serialization stays off the event loop.
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="user-store")
+
+    def _record(self, user_id: str, op: UserChange, payload: Any) -> None:
+        # Payloads are captured now; later mutations are journaled as their own changes
+        self._pending.append((user_id, op, payload))
+        self._dirty.add(user_id)
+        if len(self._pending) >= USER_FLUSH_BATCH_SIZE:
+            self._flush_requested.set()
+
+    def _write_back(self, user_id: str, user: TCGUser) -> None:
+        if user_id not in self._dirty and user_id not in self._flushing:
+            return
+
+        self._evicted[user_id] = user
+        future = self._submit_snapshot(user_id, user)
+        future.add_done_callback(lambda _: self._evicted.pop(user_id, None))
+
+    def _submit_snapshot(self, user_id: str, user: TCGUser) -> asyncio.Future:
+        self._pending = [change for change in self._pending if change[0] != user_id]
+        self._dirty.discard(user_id)
+        # The snapshot holds the changes of a flush in flight too, so a failed flush must not
+        # queue them again
+        self._flushing.discard(user_id)
+        # Copy now so changes made after this call are not baked into the snapshot as well as
+        # journaled on their own.
+        return asyncio.get_running_loop().run_in_executor(
+            self._executor, self.store.save_user, user_id, user.model_copy(deep=True)
+        )
+
+    def mark_dirty(self, user_id: str) -> None:
+        """Queue a full copy of a user for the next flush.
+
+        Prefer the dedicated mutation methods, which only journal the change itself.
+        """
+        user = self.get_user(user_id)
+        self._record(user_id, UserChange.REPLACE, user.model_dump(mode="json"))
+
+    async def _run_in_store(self, func: Any, *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    async def flush(self) -> int:
+        """Append every pending change to the journal and return how many were written."""
+        if not self._pending:
+            return 0
+
+        pending, self._pending = self._pending, []
+        self._flushing, self._dirty = self._dirty, set()
+        try:
+            await self._run_in_store(self.store.append_changes, pending)
+        except Exception:
+            # Keep the changes queued so the next flush retries them, except those of users
+            # snapshotted in the meantime
+            retry = [change for change in pending if change[0] in self._flushing]
+            self._pending = retry + self._pending
+            self._dirty |= self._flushing
+            raise
+        finally:
+            self._flushing = set()
+
+        if self.store.journal_size >= USER_JOURNAL_COMPACT_SIZE:
+            compacted = await self._run_in_store(self.store.compact)
+            LOGGER.debug("Compacted the user journal into %d snapshots", compacted)
+
+        return len(pending)
+
+    async def save_user(self, user_id: str) -> None:
+        """Write a full snapshot of one user right away instead of waiting for the next flush."""
+        await self._submit_snapshot(user_id, self.get_user(user_id))
+
+    async def run_write_behind(self) -> None:
+        """Flush pending changes every interval, or sooner once the batch size is reached."""
+        while True:
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=USER_FLUSH_INTERVAL)
+            self._flush_requested.clear()
+
+            try:
+                flushed = await self.flush()
+            except Exception:
+                LOGGER.exception("Failed to flush user changes.")
+                continue
 
-    def save_users(self) -> None:
-        save_all_users(self.users)
+            if flushed:
+                LOGGER.debug("Flushed %d user changes", flushed)
+
+    async def close(self) -> None:
+        await self.flush()
+        await self._run_in_store(self.store.compact)
+        await self._run_in_store(self.store.close)
+        self._executor.shutdown()
+        self.battle_log.close()
+
+    async def reload_cards(self) -> dict[str, list[str]]:
+        """Re-import changed card modules and swap in the new card mapping.
+
+        The mapping is replaced in one assignment on the event loop, so lookups never see a
+        half-built catalog. Battles already in progress hold their own card objects and are
+        unaffected. Returns the names of the added, updated and removed cards.
+        """
+        old_cards = self.cards
+        new_cards = await asyncio.to_thread(reload_cards, old_cards)
+
+        for name in sorted(new_cards):
+            CARD_REGISTRY.register(name)
+        await self._run_in_store(self.store.save_card_ids)
+
+        # Built off the event loop, then swapped in with the cards it renders
+        card_embeds = await asyncio.to_thread(CardEmbedCache, new_cards)
+        self.cards = new_cards
+        self.card_embeds = card_embeds
+        return {
+            "added": sorted(new_cards.keys() - old_cards.keys()),
+            "updated": sorted(
+                name
+                for name in new_cards.keys() & old_cards.keys()
+                if new_cards[name] is not old_cards[name]
+            ),
+            "removed": sorted(old_cards.keys() - new_cards.keys()),
+        }
+
+    def cache_stats(self) -> dict[str, float]:
+        return {
+            "resident": len(self.users),
+            "hits": self.users.hits,
+            "misses": self.users.misses,
+            "hit_rate": self.users.hit_rate,
+            "evictions": self.users.evictions,
+        }
+
+    def has_user(self, user_id: str) -> bool:
+        """Whether the user exists; one who isn't cached is looked up in the store on the
+        calling thread, so on the event loop use ``user_exists``."""
+        return user_id in self.users or user_id in self._evicted or self.store.has_user(user_id)
+
+    async def user_exists(self, user_id: str) -> bool:
+        """``has_user``, with the store lookup run on the store's worker thread."""
+        if user_id in self.users or user_id in self._evicted:
+            return True
+        return await self._run_in_store(self.store.has_user, user_id)
+
+    def _create_user(self, user_id: str) -> TCGUser:
+        user = TCGUser()
+        self.users.put(user_id, user)
+        self._record(user_id, UserChange.CREATE, user.model_dump(mode="json"))
+        return user
 
     def add_user(self, user_id: str) -> None:
-        self.users[user_id] = TCGUser()
-        self.save_users()
+        self._create_user(user_id)
 
     def get_user(self, user_id: str) -> TCGUser:
-        if user_id not in self.users:
-            self.users[user_id] = TCGUser()
-            self.save_users()
-        return self.users[user_id]
+        """The cached user, or one read from the store on the calling thread.
+
+        Commands await ``fetch_user`` once before using this, so it only hits the cache.
+        """
+        user = self.users.get(user_id)
+        if user is not None:
+            return user
+
+        user = self._evicted.get(user_id) or self.store.load_user(user_id)
+        if user is None:
+            return self._create_user(user_id)
+
+        self.users.put(user_id, user)
+        return user
+
+    async def fetch_user(self, user_id: str) -> TCGUser:
+        """``get_user``, with a cache miss read on the store's worker thread.
+
+        Reads queue behind the writes already submitted there, so they see every change.
+        """
+        if user_id not in self.users and user_id not in self._evicted:
+            user = await self._run_in_store(self.store.load_user, user_id)
+            # Another command may have loaded or created the user while this one waited
+            if user_id not in self.users and user_id not in self._evicted:
+                if user is None:
+                    return self._create_user(user_id)
+                self.users.put(user_id, user)
+                return user
+        return self.get_user(user_id)
 
     def add_currency(self, user_id: str, amount: int) -> None:
-        self.users[user_id].currency += amount
+        self.get_user(user_id).currency += amount
+        self._record(user_id, UserChange.CURRENCY, amount)
 
     def add_card(self, user_id: str, card_name: str) -> None:
-        if card_name not in self.users[user_id].owned_cards:
-            self.users[user_id].owned_cards.append(card_name)
+        if self.get_user(user_id).owned_cards.add(card_name):
+            self._record(user_id, UserChange.CARD, card_name)
+
+    def add_deck(self, user_id: str, deck: CardDeck) -> None:
+        decks = self.get_user(user_id).decks
+        decks.append(deck)
+        self._record(
+            user_id,
+            UserChange.DECK_SET,
+            {"index": len(decks) - 1, "deck": deck.model_dump(mode="json")},
+        )
+
+    def update_deck(self, user_id: str, index: int, name: str, cards: list[str]) -> None:
+        deck = self.get_user(user_id).decks[index]
+        deck.name = name
+        deck.cards = [CARD_REGISTRY.canonical(card) for card in cards]
+        self._record(
+            user_id, UserChange.DECK_SET, {"index": index, "deck": deck.model_dump(mode="json")}
+        )
+
+    def delete_deck(self, user_id: str, index: int) -> CardDeck:
+        deck = self.get_user(user_id).decks.pop(index)
+        self._record(user_id, UserChange.DECK_DELETE, index)
+        return deck
+
+    def set_active_deck(self, user_id: str, index: int) -> None:
+        self.get_user(user_id).active_deck_index = index
+        self._record(user_id, UserChange.ACTIVE_DECK, index)
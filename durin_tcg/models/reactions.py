@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import NamedTuple
+
+from durin_tcg.constants import DAMAGE_TYPE_BITS, ELEMENTAL_REACTIONS, NON_AURA_DAMAGE_TYPES
+from durin_tcg.enums import CardDamageType, CardReaction
+
+
+class Reaction(NamedTuple):
+    auras: int  # the target's aura mask after the hit
+    bonus: int  # extra damage dealt
+    reaction: CardReaction | None
+
+
+def _react(auras: int, damage_type: CardDamageType) -> Reaction:
+    for aura in CardDamageType:
+        if not auras & DAMAGE_TYPE_BITS[aura]:
+            continue
+        reaction = ELEMENTAL_REACTIONS.get((aura, damage_type)) or ELEMENTAL_REACTIONS.get(
+            (damage_type, aura)
+        )
+        if reaction is not None:
+            return Reaction(auras & ~DAMAGE_TYPE_BITS[aura], reaction[1], reaction[0])
+
+    if damage_type not in NON_AURA_DAMAGE_TYPES:
+        auras |= DAMAGE_TYPE_BITS[damage_type]
+    return Reaction(auras, 0, None)
+
+
+def _build_table() -> tuple[dict[int, Reaction], ...]:
+    table = []
+    for auras in range(1 << len(CardDamageType)):
+        # Element bit 0 is an ability without a damage type, which leaves the auras alone
+        row = {0: Reaction(auras, 0, None)}
+        for damage_type, bit in DAMAGE_TYPE_BITS.items():
+            row[bit] = _react(auras, damage_type)
+        table.append(row)
+    return tuple(table)
+
+
+# REACTION_TABLE[auras][element bit] is what a hit of that element does to a target with those
+# auras. Reactions consume the aura they react with, so a target holds at most a few auras and
+# every hit is a single lookup.
+REACTION_TABLE = _build_table()
+
+
+def aura_types(auras: int) -> list[CardDamageType]:
+    return [damage_type for damage_type, bit in DAMAGE_TYPE_BITS.items() if auras & bit]
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+from typing import Annotated
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
+
+from durin_tcg.models.card_registry import CARD_REGISTRY, CardSet
+
+
+def _canonical_names(names: list[str]) -> list[str]:
+    return [CARD_REGISTRY.canonical(name) for name in names]
 
 
 class CardDeck(BaseModel):
     name: str = "Untitled Deck"
-    cards: list[str] = Field(default_factory=list)
+    # Deck order matters, so decks keep a list, but every name is the registry's shared copy
+    cards: Annotated[list[str], AfterValidator(_canonical_names)] = Field(default_factory=list)
 
 
 class CardSettings(BaseModel):
@@ -16,7 +24,7 @@ class CardSettings(BaseModel):
 
 
 class TCGUser(BaseModel):
-    owned_cards: list[str] = Field(default_factory=list)
+    owned_cards: CardSet = Field(default_factory=CardSet)
     decks: list[CardDeck] = Field(default_factory=list)
     active_deck_index: int = 0
     currency: int = 0
@@ -0,0 +1,81 @@
+"""
+Run a batch of headless battles between two decks and print aggregate statistics.
+
+Example: python -m durin_tcg.simulation "Ayaka,Xiao" "Hu Tao,Diluc" --games 100000 --workers 8
+
+With --vectorized every game runs in lockstep on NumPy arrays in this process instead, which
+needs the simulation extra (NumPy) installed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import operator
+import os
+import time
+
+from durin_tcg.simulation.engine import simulate
+from durin_tcg.simulation.policies import GreedyPolicy, RandomPolicy
+from durin_tcg.utils.reading_cards import read_cards
+
+POLICIES = {"random": RandomPolicy, "greedy": GreedyPolicy}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("deck1", help="comma separated card names")
+    parser.add_argument("deck2", help="comma separated card names")
+    parser.add_argument("--games", type=int, default=10_000)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--policy1", choices=POLICIES, default="random")
+    parser.add_argument("--policy2", choices=POLICIES, default="random")
+    parser.add_argument("--vectorized", action="store_true", help="ignores --workers")
+    args = parser.parse_args()
+
+    cards = read_cards()
+    deck1 = [name.strip() for name in args.deck1.split(",")]
+    deck2 = [name.strip() for name in args.deck2.split(",")]
+
+    start = time.perf_counter()
+    if args.vectorized:
+        # Only imported here since it needs NumPy
+        from durin_tcg.simulation import vectorized  # noqa: PLC0415
+
+        policies = {"random": vectorized.random_policy, "greedy": vectorized.greedy_policy}
+        report = vectorized.simulate_vectorized(
+            cards,
+            deck1,
+            deck2,
+            policies[args.policy1],
+            policies[args.policy2],
+            games=args.games,
+            seed=args.seed,
+        )
+    else:
+        report = simulate(
+            cards,
+            deck1,
+            deck2,
+            POLICIES[args.policy1](),
+            POLICIES[args.policy2](),
+            games=args.games,
+            workers=args.workers,
+            seed=args.seed,
+        )
+    elapsed = time.perf_counter() - start
+
+    print(f"{report.games} games in {elapsed:.2f}s ({report.games / elapsed:,.0f} games/s)")
+    print(f"deck 1 win rate: {report.deck1_win_rate:.2%}")
+    print(f"deck 2 win rate: {report.deck2_win_rate:.2%}")
+    print(f"draws (turn limit): {report.draws}")
+    print(f"average turns: {report.average_turns:.2f}")
+    print("average damage per game:")
+    for name, damage in sorted(
+        report.average_damage_by_card().items(), key=operator.itemgetter(1), reverse=True
+    ):
+        print(f"  {name}: {damage:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import copy
+import functools
+import io
+import multiprocessing
+import pathlib
+import pickle
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from types import FunctionType
+from typing import TYPE_CHECKING
+
+from durin_tcg.models.battle_state import SWITCH_ACTION, BattleState
+from durin_tcg.models.game import Battle, Character, Player
+from durin_tcg.utils.reading_cards import import_card_module
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from durin_tcg.models.cards import Card
+    from durin_tcg.simulation.policies import Policy
+
+# Cards sent to each worker process once, by _init_worker
+_WORKER_CARDS: dict[str, Card] = {}
+
+
+@dataclass(slots=True)
+class BattleResult:
+    winner: int  # 1 or 2 for the deck that won, 0 for a draw at the turn limit
+    turns: int
+    damage_by_card: Counter[str]
+
+
+@dataclass(slots=True)
+class SimulationReport:
+    games: int = 0
+    deck1_wins: int = 0
+    deck2_wins: int = 0
+    draws: int = 0
+    total_turns: int = 0
+    damage_by_card: Counter[str] = field(default_factory=Counter)
+    games_by_card: Counter[str] = field(default_factory=Counter)
+
+    @property
+    def deck1_win_rate(self) -> float:
+        return self.deck1_wins / self.games if self.games else 0.0
+
+    @property
+    def deck2_win_rate(self) -> float:
+        return self.deck2_wins / self.games if self.games else 0.0
+
+    @property
+    def average_turns(self) -> float:
+        return self.total_turns / self.games if self.games else 0.0
+
+    def average_damage_by_card(self) -> dict[str, float]:
+        """Average damage each card dealt per game it was in a deck for."""
+        return {
+            name: self.damage_by_card[name] / games for name, games in self.games_by_card.items()
+        }
+
+    def add(self, result: BattleResult, deck1: Sequence[str], deck2: Sequence[str]) -> None:
+        self.games += 1
+        self.total_turns += result.turns
+        if result.winner == 1:
+            self.deck1_wins += 1
+        elif result.winner == 2:
+            self.deck2_wins += 1
+        else:
+            self.draws += 1
+
+        self.damage_by_card.update(result.damage_by_card)
+        self.games_by_card.update(set(deck1) | set(deck2))
+
+    def merge(self, other: SimulationReport) -> None:
+        self.games += other.games
+        self.deck1_wins += other.deck1_wins
+        self.deck2_wins += other.deck2_wins
+        self.draws += other.draws
+        self.total_turns += other.total_turns
+        self.damage_by_card.update(other.damage_by_card)
+        self.games_by_card.update(other.games_by_card)
+
+
+def build_player(cards: dict[str, Card], deck: Sequence[str]) -> Player:
+    characters = [Character(cards[name]) for name in deck]
+    return Player(characters, characters[0])
+
+
+def play_battle(battle: Battle, policy1: Policy, policy2: Policy) -> BattleResult:
+    """Play a battle to the end without any Discord interaction.
+
+    The battle is played on a BattleState with the same rules as Battle.step, and the final
+    state is written back into ``battle``. Abilities' add_func hooks only run in Battle.step,
+    so they have no effect here.
+    """
+    damage: Counter[str] = Counter()
+    rng = battle.rng
+    policies = (policy1, policy2)
+    state = BattleState.from_battle(battle)
+
+    while not state.is_over:
+        player = state.to_move
+        action = policies[player].choose_action(state, rng)
+        if action >= SWITCH_ACTION:
+            state.apply(action)
+            continue
+
+        name = state.card_name(player, state.active(player))
+        health = state.team_health(1 - player)
+        state.apply(action)
+        damage[name] += health - state.team_health(1 - player)
+
+    state.apply_to(battle)
+    winner = state.winner
+    return BattleResult(0 if winner is None else winner + 1, state.turns_played, damage)
+
+
+def _run_games(
+    cards: dict[str, Card],
+    deck1: Sequence[str],
+    deck2: Sequence[str],
+    policy1: Policy,
+    policy2: Policy,
+    seeds: range,
+) -> SimulationReport:
+    report = SimulationReport()
+    for seed in seeds:
+        battle = Battle(build_player(cards, deck1), build_player(cards, deck2), seed=seed)
+        # Alternate who moves first so neither deck gets the first-turn advantage every game
+        battle.player1_turn = seed % 2 == 0
+        result = play_battle(battle, copy.copy(policy1), copy.copy(policy2))
+        report.add(result, deck1, deck2)
+    return report
+
+
+def _card_modules(cards: dict[str, Card]) -> list[tuple[str, str]]:
+    """Name and file of every card module the cards' classes and add_func hooks come from."""
+    modules: dict[str, str] = {}
+    for card in cards.values():
+        hooks = [ability.add_func for ability in card.abilities if ability.add_func is not None]
+        for obj in (type(card), *hooks):
+            module = sys.modules.get(obj.__module__)
+            file = getattr(module, "__file__", None)
+            if file is not None and not obj.__module__.startswith("durin_tcg."):
+                modules[obj.__module__] = file
+    return sorted(modules.items())
+
+
+class _CardPickler(pickle.Pickler):
+    """Pickles classes and functions from card modules by name, since pickle itself can't
+    import those modules to check them."""
+
+    def __init__(self, file: io.BytesIO, modules: set[str]) -> None:
+        super().__init__(file)
+        self.modules = modules
+
+    def persistent_id(self, obj: object) -> tuple[str, str] | None:
+        if isinstance(obj, type | FunctionType) and obj.__module__ in self.modules:
+            return obj.__module__, obj.__qualname__
+        return None
+
+
+class _CardUnpickler(pickle.Unpickler):
+    def persistent_load(self, pid: tuple[str, str]) -> object:
+        module, qualname = pid
+        return functools.reduce(getattr, qualname.split("."), sys.modules[module])
+
+
+def _init_worker(payload: bytes, modules: list[tuple[str, str]]) -> None:
+    for name, file in modules:
+        import_card_module(name, pathlib.Path(file))
+    _WORKER_CARDS.update(_CardUnpickler(io.BytesIO(payload)).load())
+
+
+def _run_games_in_worker(
+    deck1: Sequence[str], deck2: Sequence[str], policy1: Policy, policy2: Policy, seeds: range
+) -> SimulationReport:
+    return _run_games(_WORKER_CARDS, deck1, deck2, policy1, policy2, seeds)
+
+
+def simulate(
+    cards: dict[str, Card],
+    deck1: Sequence[str],
+    deck2: Sequence[str],
+    policy1: Policy,
+    policy2: Policy,
+    *,
+    games: int,
+    workers: int = 0,
+    seed: int = 0,
+) -> SimulationReport:
+    """Play ``games`` battles between two decks and aggregate the results.
+
+    Game ``i`` is seeded with ``seed + i``, so a simulation is reproducible regardless of the
+    number of workers. With ``workers`` > 1 the games are spread over a process pool, and
+    each worker is sent the decks' cards from ``cards`` once at startup, so cards changed in
+    memory play the same there as in this process.
+    """
+    missing = [name for name in (*deck1, *deck2) if name not in cards]
+    if missing:
+        msg = f"Unknown cards: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    seeds = range(seed, seed + games)
+    if workers <= 1:
+        return _run_games(cards, deck1, deck2, policy1, policy2, seeds)
+
+    # A few chunks per worker keeps them busy without paying per-game IPC
+    chunk_size = max(1, -(-games // (workers * 4)))
+    chunks = [seeds[i : i + chunk_size] for i in range(0, games, chunk_size)]
+
+    deck_cards = {name: cards[name] for name in {*deck1, *deck2}}
+    modules = _card_modules(deck_cards)
+    payload = io.BytesIO()
+    _CardPickler(payload, {name for name, _ in modules}).dump(deck_cards)
+
+    report = SimulationReport()
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(payload.getvalue(), modules),
+    ) as executor:
+        futures = [
+            executor.submit(_run_games_in_worker, deck1, deck2, policy1, policy2, chunk)
+            for chunk in chunks
+        ]
+        for future in futures:
+            report.merge(future.result())
+    return report
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Protocol
+
+from durin_tcg.enums import CardAbility
+from durin_tcg.models.battle_state import ACTION_BASIC, SWITCH_ACTION, action_for
+
+if TYPE_CHECKING:
+    import random
+    from collections.abc import Sequence
+
+    from durin_tcg.models.battle_state import BattleState
+
+
+class Policy(Protocol):
+    """Decides a player's moves in a headless battle.
+
+    Policies are pickled into simulation workers and copied for every battle, so they may keep
+    per-battle state on themselves. Randomness must come from ``rng``, the battle's seeded RNG.
+    """
+
+    def choose_action(self, state: BattleState, rng: random.Random) -> int:
+        """One of ``state.legal_actions()`` for the player to move."""
+        ...
+
+
+def _abilities(actions: list[int]) -> list[int]:
+    return [action for action in actions if action < SWITCH_ACTION]
+
+
+def _healthiest(state: BattleState, switches: list[int]) -> int:
+    player = state.to_move
+    return max(switches, key=lambda action: state.character(player, action - SWITCH_ACTION)[0])
+
+
+class RandomPolicy:
+    """Picks a uniformly random affordable ability and only switches when it has to."""
+
+    def choose_action(self, state: BattleState, rng: random.Random) -> int:
+        actions = state.legal_actions()
+        return rng.choice(_abilities(actions) or actions)
+
+
+class GreedyPolicy:
+    """Uses the affordable ability with the highest damage number, and replaces a knocked out
+    character with the healthiest one left."""
+
+    def choose_action(self, state: BattleState, _rng: random.Random) -> int:
+        actions = state.legal_actions()
+        abilities = _abilities(actions)
+        if not abilities:
+            return _healthiest(state, actions)
+
+        player = state.to_move
+        stats = state.abilities[player][state.active(player)]
+        return max(abilities, key=lambda action: stats[action][0])
+
+
+class ScriptedPolicy:
+    """Replays a fixed, repeating script of moves.
+
+    Each step is either an ability or a deck index to switch to before the next ability. A
+    step that isn't legal when its turn comes is skipped for a basic attack, or for the
+    healthiest character when a knocked out one must be replaced.
+    """
+
+    def __init__(self, script: Sequence[CardAbility | int]) -> None:
+        if not any(isinstance(step, CardAbility) for step in script):
+            msg = "A script needs at least one ability"
+            raise ValueError(msg)
+        self.script = list(script)
+        self.position = 0
+
+    def choose_action(self, state: BattleState, _rng: random.Random) -> int:
+        step = self.script[self.position % len(self.script)]
+        self.position += 1
+        action = action_for(step) if isinstance(step, CardAbility) else SWITCH_ACTION + step
+
+        actions = state.legal_actions()
+        if action in actions:
+            return action
+        if ACTION_BASIC in actions:
+            return ACTION_BASIC
+        return _healthiest(state, actions)
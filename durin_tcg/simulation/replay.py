@@ -0,0 +1,41 @@
+"""
+Print the state of a logged battle at any turn.
+
+Example: python -m durin_tcg.simulation.replay battle_log.jsonl BATTLE_ID --turn 5
+"""
+
+from __future__ import annotations
+
+import argparse
+
+from durin_tcg.models.battle_log import read_battle_log, replay
+from durin_tcg.models.reactions import aura_types
+from durin_tcg.utils.reading_cards import read_cards
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("log_file")
+    parser.add_argument("battle_id")
+    parser.add_argument("--turn", type=int, default=None, help="defaults to the end of the battle")
+    args = parser.parse_args()
+
+    record = read_battle_log(args.log_file)[args.battle_id]
+    state = replay(record, read_cards(), turn=args.turn)
+
+    print(f"Battle {record.battle_id} (seed {record.seed}), turns played: {state.turns_played}")
+    for player, deck in enumerate(record.decks):
+        print(f"Player {player + 1} ({state.action_points(player)} action points):")
+        for index, name in enumerate(deck):
+            hp, shield, auras = state.character(player, index)
+            active = " [Active]" if index == state.active(player) else ""
+            auras_str = ", ".join(aura_types(auras)) or "none"
+            print(f"  {name}: HP {hp}, shield {shield}, auras {auras_str}{active}")
+    if state.winner is not None:
+        print(f"Player {state.winner + 1} won")
+    elif state.is_over:
+        print("The battle ended in a draw")
+
+
+if __name__ == "__main__":
+    main()
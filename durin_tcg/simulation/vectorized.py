@@ -0,0 +1,271 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import TYPE_CHECKING
+
+from durin_tcg.constants import (
+    ACTION_POINTS_PER_TURN,
+    BATTLE_TURN_LIMIT,
+    CARD_BASE_HP,
+    MAX_ACTION_POINTS,
+    STARTING_ACTION_POINTS,
+    SWITCH_COST,
+)
+from durin_tcg.models.battle_state import ability_stats
+from durin_tcg.models.reactions import REACTION_TABLE
+from durin_tcg.simulation.engine import SimulationReport
+
+try:
+    import numpy as np
+except ImportError as e:
+    msg = "The vectorized evaluator needs NumPy, install durin-tcg[simulation]"
+    raise ImportError(msg) from e
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from numpy.typing import NDArray
+
+    from durin_tcg.models.battle_state import AbilityStats
+    from durin_tcg.models.cards import Card
+    from durin_tcg.models.game import Battle
+
+    type IntArray = NDArray[np.int32]
+    # Returns the deck index to switch to (-1 for none) and the action of every game's ``player``
+    type VectorPolicy = Callable[[BattleBatch, int, np.random.Generator], tuple[IntArray, IntArray]]
+
+NO_SWITCH = -1
+
+
+def _element_columns(bits: IntArray) -> IntArray:
+    """Columns of element bits in the reaction arrays; 0 is an ability without an element."""
+    columns = np.zeros_like(bits)
+    nonzero = bits != 0
+    columns[nonzero] = np.log2(bits[nonzero]).astype(np.int32) + 1
+    return columns
+
+
+def _reaction_arrays() -> tuple[IntArray, IntArray]:
+    bits = list(REACTION_TABLE[0])
+    columns = _element_columns(np.array(bits, dtype=np.int32))
+    auras = np.zeros((len(REACTION_TABLE), int(columns.max()) + 1), dtype=np.int32)
+    bonus = np.zeros_like(auras)
+    for mask, row in enumerate(REACTION_TABLE):
+        for bit, column in zip(bits, columns, strict=True):
+            auras[mask, column] = row[bit].auras
+            bonus[mask, column] = row[bit].bonus
+    return auras, bonus
+
+
+# REACTION_TABLE as arrays indexed by [auras, element column]
+REACTION_AURAS, REACTION_BONUS = _reaction_arrays()
+
+
+class BattleBatch:
+    """Many independent battles stepped in lockstep, one NumPy operation per tick.
+
+    Every battle's characters are (games, 2, deck size) arrays of HP, shield and auras, with
+    each card's ability damage, element column and cost alongside, so a tick plays one turn of
+    every unfinished battle at once. A turn is what it is in BattleState: an optional switch,
+    required when the active character is knocked out, then one ability. Damage follows the
+    default stages of ``damage.DAMAGE_PIPELINE``, without add_func hooks, and battles end on a
+    knocked out team or at BATTLE_TURN_LIMIT.
+    """
+
+    def __init__(
+        self,
+        decks: Sequence[tuple[Sequence[Card], Sequence[Card]]],
+        first_player: IntArray | None = None,
+    ) -> None:
+        games = len(decks)
+        size = len(decks[0][0])
+        if any(len(deck) != size for pair in decks for deck in pair):
+            msg = "Every deck in a batch must have the same number of characters"
+            raise ValueError(msg)
+
+        # Batches usually repeat a handful of matchups, so build each one's tables once
+        matchups: dict[tuple[str, ...], int] = {}
+        tables: list[tuple[tuple[tuple[AbilityStats, ...], ...], ...]] = []
+        rows = np.empty(games, dtype=np.intp)
+        for game, pair in enumerate(decks):
+            key = tuple(card.name for deck in pair for card in deck)
+            if key not in matchups:
+                matchups[key] = len(tables)
+                tables.append(tuple(tuple(ability_stats(card) for card in deck) for deck in pair))
+            rows[game] = matchups[key]
+
+        # (matchup, player, deck index, action, AbilityStats field)
+        stats = np.array(tables, dtype=np.int32).reshape(len(tables), 2, size, 3, 3)
+        self.games = games
+        self.damage = stats[rows, ..., 0]
+        self.element = _element_columns(stats[rows, ..., 1])
+        self.cost = stats[rows, ..., 2]
+        self.hp = np.full((games, 2, size), CARD_BASE_HP, dtype=np.int32)
+        self.shield = np.zeros((games, 2, size), dtype=np.int32)
+        self.auras = np.zeros((games, 2, size), dtype=np.int32)
+        self.active = np.zeros((games, 2), dtype=np.int32)
+        self.action_points = np.full((games, 2), STARTING_ACTION_POINTS, dtype=np.int32)
+        self.turn = np.zeros(games, dtype=np.int32) if first_player is None else first_player.copy()
+        self.turns_played = np.zeros(games, dtype=np.int32)
+        # HP and shield each character took off the enemy team
+        self.dealt = np.zeros((games, 2, size), dtype=np.int32)
+        self.indices = np.arange(games)  # for indexing one element per game
+
+    @classmethod
+    def from_battles(cls, battles: Sequence[Battle]) -> BattleBatch:
+        """A batch starting from the current state of ``battles``, which must be at the start
+        of a turn."""
+        batch = cls(
+            [
+                (
+                    [char.card for char in battle.player1.deck],
+                    [char.card for char in battle.player2.deck],
+                )
+                for battle in battles
+            ],
+            np.array([0 if battle.player1_turn else 1 for battle in battles], dtype=np.int32),
+        )
+        for game, battle in enumerate(battles):
+            for player, side in enumerate((battle.player1, battle.player2)):
+                for index, char in enumerate(side.deck):
+                    batch.hp[game, player, index] = char.current_hp
+                    batch.shield[game, player, index] = char.current_shield
+                    batch.auras[game, player, index] = char.auras
+                batch.active[game, player] = side.deck.index(side.active_character)
+                batch.action_points[game, player] = side.action_points
+            batch.turns_played[game] = battle.turns_played
+        return batch
+
+    def active_hp(self, player: int) -> IntArray:
+        return self.hp[self.indices, player, self.active[:, player]]
+
+    def winners(self) -> IntArray:
+        """1 or 2 for the player who won each game, 0 while it is undecided or was drawn."""
+        knocked_out = (self.hp <= 0).all(axis=2)
+        return np.where(knocked_out[:, 0], 2, np.where(knocked_out[:, 1], 1, 0))
+
+    def done(self) -> NDArray[np.bool_]:
+        return (self.winners() != 0) | (self.turns_played >= BATTLE_TURN_LIMIT)
+
+    def step(self, switch: IntArray, action: IntArray) -> None:
+        """Play one turn of every unfinished game.
+
+        ``switch`` holds the deck index each game's player to move switches to first, or
+        NO_SWITCH, and ``action`` the ability they then use, as a BattleState action. Both
+        must be legal, as the policies below make sure; they aren't checked.
+        """
+        games = np.flatnonzero(~self.done())
+        mover = self.turn[games]
+        enemy = 1 - mover
+
+        # Replacing a knocked out character is free, other switches cost action points
+        switching = switch[games] != NO_SWITCH
+        forced = self.hp[games, mover, self.active[games, mover]] <= 0
+        points = self.action_points[games, mover] - np.where(switching & ~forced, SWITCH_COST, 0)
+        self.active[games[switching], mover[switching]] = switch[games][switching]
+
+        attacker = self.active[games, mover]
+        chosen = action[games]
+        self.action_points[games, mover] = points - self.cost[games, mover, attacker, chosen]
+        column = self.element[games, mover, attacker, chosen]
+
+        target = self.active[games, enemy]
+        auras = self.auras[games, enemy, target]
+        damage = self.damage[games, mover, attacker, chosen] + REACTION_BONUS[auras, column]
+        self.auras[games, enemy, target] = REACTION_AURAS[auras, column]
+
+        # absorb_shield and apply_damage, for every game at once
+        hp = self.hp[games, enemy, target]
+        shield = self.shield[games, enemy, target]
+        absorbed = np.minimum(shield, damage)
+        new_hp = np.maximum(hp - (damage - absorbed), 0)
+        self.shield[games, enemy, target] = shield - absorbed
+        self.hp[games, enemy, target] = new_hp
+        self.dealt[games, mover, attacker] += hp - new_hp + absorbed
+
+        self.action_points[games, enemy] = np.minimum(
+            self.action_points[games, enemy] + ACTION_POINTS_PER_TURN, MAX_ACTION_POINTS
+        )
+        self.turn[games] = enemy
+        self.turns_played[games] += 1
+
+    def run(self, policy1: VectorPolicy, policy2: VectorPolicy, rng: np.random.Generator) -> None:
+        """Play every game to the end."""
+        while not self.done().all():
+            switch1, action1 = policy1(self, 0, rng)
+            switch2, action2 = policy2(self, 1, rng)
+            player1 = self.turn == 0
+            self.step(np.where(player1, switch1, switch2), np.where(player1, action1, action2))
+
+    def forced_switches(self, player: int, scores: NDArray[np.float64]) -> IntArray:
+        """The switch of every game where ``player``'s active character is knocked out, to the
+        living character with the highest score, and NO_SWITCH elsewhere."""
+        alive = self.hp[:, player] > 0
+        best = np.where(alive, scores, -np.inf).argmax(axis=1).astype(np.int32)
+        return np.where(self.active_hp(player) <= 0, best, NO_SWITCH).astype(np.int32)
+
+    def affordable(self, player: int, switch: IntArray) -> NDArray[np.bool_]:
+        """Which abilities ``player`` can pay for after ``switch``, as (games, 3)."""
+        active = np.where(switch != NO_SWITCH, switch, self.active[:, player])
+        return self.cost[self.indices, player, active] <= self.action_points[:, player, None]
+
+
+def random_policy(
+    batch: BattleBatch, player: int, rng: np.random.Generator
+) -> tuple[IntArray, IntArray]:
+    """Vectorized RandomPolicy."""
+    switch = batch.forced_switches(player, rng.random((batch.games, batch.hp.shape[2])))
+    scores = np.where(batch.affordable(player, switch), rng.random((batch.games, 3)), -1.0)
+    return switch, scores.argmax(axis=1).astype(np.int32)
+
+
+def greedy_policy(
+    batch: BattleBatch, player: int, _rng: np.random.Generator
+) -> tuple[IntArray, IntArray]:
+    """Vectorized GreedyPolicy; ties go to the first candidate, like max()."""
+    switch = batch.forced_switches(player, batch.hp[:, player].astype(np.float64))
+    active = np.where(switch != NO_SWITCH, switch, batch.active[:, player])
+    damage = batch.damage[batch.indices, player, active]
+    scores = np.where(batch.affordable(player, switch), damage, -1)
+    return switch, scores.argmax(axis=1).astype(np.int32)
+
+
+def simulate_vectorized(
+    cards: dict[str, Card],
+    deck1: Sequence[str],
+    deck2: Sequence[str],
+    policy1: VectorPolicy,
+    policy2: VectorPolicy,
+    *,
+    games: int,
+    seed: int = 0,
+) -> SimulationReport:
+    """``engine.simulate`` on a BattleBatch.
+
+    The decks alternate moving first like in ``simulate``, but the moves come from a NumPy
+    generator seeded with ``seed``, so individual games differ from the object engine's.
+    """
+    missing = [name for name in (*deck1, *deck2) if name not in cards]
+    if missing:
+        msg = f"Unknown cards: {', '.join(missing)}"
+        raise ValueError(msg)
+
+    pair = ([cards[name] for name in deck1], [cards[name] for name in deck2])
+    first_player = (np.arange(seed, seed + games) % 2).astype(np.int32)
+    batch = BattleBatch([pair] * games, first_player)
+    batch.run(policy1, policy2, np.random.default_rng(seed))
+
+    winners = batch.winners()
+    report = SimulationReport(
+        games=games,
+        deck1_wins=int((winners == 1).sum()),
+        deck2_wins=int((winners == 2).sum()),
+        draws=int((winners == 0).sum()),
+        total_turns=int(batch.turns_played.sum()),
+    )
+    dealt = batch.dealt.sum(axis=0)
+    for player, deck in enumerate((deck1, deck2)):
+        for index, name in enumerate(deck):
+            report.damage_by_card[name] += int(dealt[player, index])
+    report.games_by_card = Counter(dict.fromkeys(set(deck1) | set(deck2), games))
+    return report
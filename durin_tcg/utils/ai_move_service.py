@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Any
+
+from durin_tcg.config import CONFIG
+from durin_tcg.constants import AI_MOVE_TIMEOUT_GRACE
+from durin_tcg.exceptions import AIServiceBusyError
+from durin_tcg.models.ai_search import choose_turn
+
+if TYPE_CHECKING:
+    from durin_tcg.models.ai_search import SearchResult
+    from durin_tcg.models.battle_state import BattleState
+
+
+def _ping() -> None:
+    pass
+
+
+class AIMoveService:
+    """Computes AI moves on a pool of long-lived worker processes.
+
+    Battle states carry their own ability stats, so workers need no cards; they are started
+    once with the bot and reused for every move. At most ``workers`` searches run at a time,
+    further requests wait their turn in order, and once ``max_pending`` are waiting new
+    requests are rejected with AIServiceBusyError instead of piling up.
+    """
+
+    def __init__(
+        self, workers: int = CONFIG.ai_workers, max_pending: int = CONFIG.ai_max_pending
+    ) -> None:
+        self.workers = max(workers, 1)
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(self.workers)
+
+        self.waiting = 0
+        self.running = 0
+        self.completed = 0
+        self.timeouts = 0
+        self.rejected = 0
+        self.nodes = 0
+        self.search_time = 0.0
+
+    def start(self) -> None:
+        if self._executor is not None:
+            return
+
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+        )
+        # Spawn every worker now rather than during the first battles
+        for _ in range(self.workers):
+            self._executor.submit(_ping)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @property
+    def is_saturated(self) -> bool:
+        return self.waiting >= self.max_pending
+
+    async def choose_turn(
+        self,
+        state: BattleState,
+        *,
+        time_limit: float = CONFIG.ai_move_time,
+        node_budget: int = CONFIG.ai_node_budget,
+    ) -> tuple[int | None, int, SearchResult]:
+        """Search for a turn on a worker, see ``ai_search.choose_turn``.
+
+        Raises TimeoutError if the worker doesn't answer within the search budget plus a grace
+        period, and BrokenProcessPool if a worker died. Cancelling the caller cancels the
+        request if it hasn't started yet. A search that is abandoned while running holds on to
+        its worker slot until the worker finishes it.
+        """
+        if self._executor is None:
+            msg = "The AI move service has not been started"
+            raise RuntimeError(msg)
+        if self.is_saturated:
+            self.rejected += 1
+            raise AIServiceBusyError
+
+        self.waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.running += 1
+        try:
+            future = self._executor.submit(
+                choose_turn, state, time_limit=time_limit, node_budget=node_budget
+            )
+        except BaseException:
+            self._release()
+            raise
+
+        try:
+            try:
+                switch, action, result = await asyncio.wait_for(
+                    asyncio.wrap_future(future), time_limit + AI_MOVE_TIMEOUT_GRACE
+                )
+            except TimeoutError:
+                self.timeouts += 1
+                raise
+            except BrokenProcessPool:
+                # A worker died; replace the pool so later moves work again
+                self.close()
+                self.start()
+                raise
+        finally:
+            # A search that timed out or lost its caller keeps its worker busy until it returns,
+            # so its slot is only given back then
+            if future.done():
+                self._release()
+            else:
+                loop = asyncio.get_running_loop()
+                future.add_done_callback(lambda _: self._release_threadsafe(loop))
+
+        self.completed += 1
+        self.nodes += result.nodes
+        self.search_time += result.elapsed
+        return switch, action, result
+
+    def _release(self) -> None:
+        self.running -= 1
+        self._slots.release()
+
+    def _release_threadsafe(self, loop: asyncio.AbstractEventLoop) -> None:
+        # Called from the pool's management thread, possibly after the bot has shut down
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(self._release)
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "running": self.running,
+            "waiting": self.waiting,
+            "completed": self.completed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "nodes_per_second": self.nodes / self.search_time if self.search_time else 0.0,
+        }
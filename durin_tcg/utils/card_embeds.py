@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
+import discord
+
+from durin_tcg.l10n import DEFAULT_LOCALE, LocaleStr
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from discord.types.embed import Embed as EmbedData
+    from discord.types.embed import EmbedField
+
+    from durin_tcg.enums import Game
+    from durin_tcg.models.cards import Card
+
+
+class CardEmbedCache:
+    """Embed dicts of the card catalog, rendered once per card and locale.
+
+    Card text only changes when cards are reloaded, and GameData then replaces the whole
+    cache along with the card mapping. The default locale is rendered up front and others the
+    first time they are asked for. The cached dicts are never handed out: every embed gets
+    its own copy of them, so callers may change it freely.
+    """
+
+    def __init__(self, cards: dict[str, Card]) -> None:
+        self.cards = cards
+        self._album: dict[tuple[str, discord.Locale], EmbedData] = {}
+        self._catalog: dict[discord.Locale, EmbedData] = {}
+        self._pages: dict[tuple[discord.Locale, int, int], str] = {}
+        self._name_fields: dict[str, EmbedField] = {}
+
+        # Grouped and sorted once, since the catalog listing is the same for every locale
+        by_game: dict[Game, list[Card]] = defaultdict(list)
+        for card in cards.values():
+            by_game[card.game].append(card)
+        self._by_game = [
+            (game, sorted(by_game[game], key=lambda card: card.name)) for game in sorted(by_game)
+        ]
+
+        self.catalog(DEFAULT_LOCALE)
+        for name in cards:
+            self._album_dict(name, DEFAULT_LOCALE)
+
+    def _album_dict(self, name: str, locale: discord.Locale) -> EmbedData:
+        key = (name, locale)
+        data = self._album.get(key)
+        if data is None:
+            card = self.cards[name]
+            fields = (
+                ("cards.basic_attack", card.basic),
+                ("cards.skill", card.skill),
+                ("cards.ultimate", card.ultimate),
+            )
+            data = self._album[key] = discord.Embed(title=card.name).to_dict()
+            data["fields"] = [
+                {"name": LocaleStr(label).translate(locale), "value": ability.desc, "inline": False}
+                for label, ability in fields
+            ]
+        return data
+
+    def album(self, name: str, locale: discord.Locale, index: int, total: int) -> discord.Embed:
+        """A card's page in the album, as page ``index`` (from 0) of ``total``."""
+        page = self._pages.get((locale, index, total))
+        if page is None:
+            page = self._pages[locale, index, total] = LocaleStr(
+                "cards.album_page", index=index + 1, total=total
+            ).translate(locale)
+
+        embed = _embed(self._album_dict(name, locale))
+        embed.description = page
+        return embed
+
+    def collection(self, title: str, names: Iterable[str]) -> discord.Embed:
+        """A list of card names, like a user's collection."""
+        fields: list[EmbedField] = []
+        for name in names:
+            field = self._name_fields.get(name)
+            if field is None:
+                field = self._name_fields[name] = {"name": name, "value": "", "inline": False}
+            fields.append(field)
+        data = discord.Embed(title=title, color=discord.Color.green()).to_dict()
+        data["fields"] = fields
+        return _embed(data)
+
+    def catalog(self, locale: discord.Locale) -> discord.Embed:
+        """Every card and its element, by game."""
+        data = self._catalog.get(locale)
+        if data is None:
+            embed = discord.Embed(
+                title=LocaleStr("cards.all_title").translate(locale),
+                description=LocaleStr("cards.all_description").translate(locale),
+                color=discord.Color.blurple(),
+            )
+            for game, cards in self._by_game:
+                embed.add_field(
+                    name=LocaleStr("cards.game_cards", game=game.value).translate(locale),
+                    value="\n".join(f"• **{card.name}** — {card.element.value}" for card in cards),
+                    inline=False,
+                )
+            data = self._catalog[locale] = embed.to_dict()
+        return _embed(data)
+
+
+def _embed(data: EmbedData) -> discord.Embed:
+    # Embed.from_dict keeps the dicts it is given, so copy the fields rather than share them
+    fields = [dict(field) for field in data.get("fields", [])]
+    return discord.Embed.from_dict({**data, "fields": fields})
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+from typing import TYPE_CHECKING, Any
+
+from durin_tcg.utils.logger import LOGGER
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Coroutine, Hashable
+
+    type Expiry = Callable[[], Coroutine[Any, Any, None]]
+    # when, sequence number, key, callback; the sequence number keeps keys from being compared
+    type Entry = tuple[float, int, Hashable, Expiry]
+
+# Rebuild the heap once cancelled entries outnumber live ones by this much
+STALE_ENTRY_SLACK = 64
+
+
+class DeadlineScheduler:
+    """Runs a callback when a deadline passes, for any number of deadlines on one task.
+
+    Deadlines are kept in a heap ordered by loop time and identified by a key, such as the
+    view that owns them; scheduling a key again replaces its deadline. Replaced and cancelled
+    entries stay in the heap until they reach the top or the heap is rebuilt, so cancelling is
+    a dict removal and scheduling a heap push. The driver task sleeps until the earliest
+    deadline and then starts the callback of every deadline that is due, each on its own task.
+    """
+
+    def __init__(self) -> None:
+        self._heap: list[Entry] = []
+        self._entries: dict[Hashable, Entry] = {}
+        self._sequence = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._running: set[asyncio.Task] = set()
+
+        self.dispatched = 0
+        self.cancelled = 0
+        self.total_lag = 0.0
+        self.max_lag = 0.0
+
+    @property
+    def armed(self) -> int:
+        return len(self._entries)
+
+    def schedule(self, key: Hashable, delay: float, callback: Expiry) -> None:
+        """Run ``callback`` ``delay`` seconds from now, replacing any deadline of ``key``."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done():
+            self._task = loop.create_task(self._run())
+
+        entry = (loop.time() + delay, next(self._sequence), key, callback)
+        if not self._heap or entry < self._heap[0]:
+            self._wake.set()
+        self._entries[key] = entry
+        heapq.heappush(self._heap, entry)
+        self._compact()
+
+    def cancel(self, key: Hashable) -> bool:
+        """Disarm ``key``'s deadline; returns whether it had one."""
+        if self._entries.pop(key, None) is None:
+            return False
+        self.cancelled += 1
+        self._compact()
+        return True
+
+    def _compact(self) -> None:
+        if len(self._heap) > 2 * len(self._entries) + STALE_ENTRY_SLACK:
+            self._heap = list(self._entries.values())
+            heapq.heapify(self._heap)
+
+    def _dispatch_due(self, now: float) -> None:
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            entry = heapq.heappop(heap)
+            when, _, key, callback = entry
+            if self._entries.get(key) is not entry:
+                continue
+            del self._entries[key]
+
+            lag = now - when
+            self.dispatched += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+
+            task = asyncio.create_task(callback())
+            self._running.add(task)
+            task.add_done_callback(self._finished)
+
+    def _finished(self, task: asyncio.Task) -> None:
+        self._running.discard(task)
+        if not task.cancelled() and (e := task.exception()) is not None:
+            LOGGER.error("Deadline callback failed", exc_info=e)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            # Drop cancelled entries off the top so they don't wake the task
+            while self._heap and self._entries.get(self._heap[0][2]) is not self._heap[0]:
+                heapq.heappop(self._heap)
+
+            self._wake.clear()
+            timeout = self._heap[0][0] - loop.time() if self._heap else None
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            self._dispatch_due(loop.time())
+
+    def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        for task in self._running:
+            task.cancel()
+        self._heap.clear()
+        self._entries.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "armed": self.armed,
+            "dispatched": self.dispatched,
+            "cancelled": self.cancelled,
+            "mean_lag": self.total_lag / self.dispatched if self.dispatched else 0.0,
+            "max_lag": self.max_lag,
+        }
+
+
+DEADLINES = DeadlineScheduler()
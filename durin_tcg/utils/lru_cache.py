@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+
+class LRUCache[K, V]:
+    """A bounded mapping that evicts the least recently used entry once full.
+
+    ``on_evict`` is called with every entry pushed out, so callers can write it back somewhere
+    before it is dropped.
+    """
+
+    def __init__(self, capacity: int, on_evict: Callable[[K, V], None] | None = None) -> None:
+        self.capacity = capacity
+        self.on_evict = on_evict
+        self._entries: OrderedDict[K, V] = OrderedDict()
+
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[K]:
+        return iter(self._entries)
+
+    def get(self, key: K) -> V | None:
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: K, value: V) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.capacity:
+            old_key, old_value = self._entries.popitem(last=False)
+            self.evictions += 1
+            if self.on_evict is not None:
+                self.on_evict(old_key, old_value)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import itertools
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any
+
+from durin_tcg.constants import CHANNEL_RATE_LIMIT, CHANNEL_RATE_PERIOD
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable
+
+    import discord
+
+
+class _Request:
+    __slots__ = ("fields", "future", "kind", "target")
+
+    def __init__(self, kind: str, target: Any, fields: dict[str, Any]) -> None:
+        self.kind = kind
+        self.target = target
+        self.fields = fields
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+
+
+class _ChannelQueue:
+    __slots__ = ("pending", "sent_at", "wake", "worker")
+
+    def __init__(self) -> None:
+        self.pending: OrderedDict[Hashable, _Request] = OrderedDict()
+        # When the last CHANNEL_RATE_LIMIT requests went out, for pacing
+        self.sent_at: deque[float] = deque(maxlen=CHANNEL_RATE_LIMIT)
+        self.wake = asyncio.Event()
+        self.worker: asyncio.Task | None = None
+
+
+class OutboundMessages:
+    """Sends, edits and deletes channel messages through one paced queue per channel.
+
+    Requests for a channel go out in order, at most CHANNEL_RATE_LIMIT per CHANNEL_RATE_PERIOD
+    seconds, which is Discord's message bucket for a channel, so bursts wait here instead of
+    in discord.py's rate limiter. An edit of a message that already has one waiting is merged
+    into it, newer fields winning, and both callers get the result of the single call.
+
+    Interaction responses don't go through here: they use the interaction's own webhook and
+    must be answered within seconds.
+    """
+
+    def __init__(self) -> None:
+        self._channels: dict[int, _ChannelQueue] = {}
+        self._ids = itertools.count()
+
+        self.queued = 0
+        self.max_depth = 0
+        self.sent = 0
+        self.superseded = 0
+        self.failed = 0
+
+    @property
+    def depth(self) -> int:
+        return sum(len(queue.pending) for queue in self._channels.values())
+
+    async def send(self, channel: discord.abc.Messageable, **fields: Any) -> discord.Message:
+        return await self._enqueue(
+            self._channel_id(channel), next(self._ids), "send", channel, fields
+        )
+
+    async def edit(self, message: discord.Message, **fields: Any) -> discord.Message:
+        key = ("edit", message.id)
+        return await self._enqueue(self._channel_id(message.channel), key, "edit", message, fields)
+
+    async def delete(self, message: discord.Message) -> None:
+        await self._enqueue(
+            self._channel_id(message.channel), ("delete", message.id), "delete", message, {}
+        )
+
+    @staticmethod
+    def _channel_id(channel: discord.abc.Messageable) -> int:
+        # DMs and users are Messageable without being channels
+        return getattr(channel, "id", id(channel))
+
+    async def _enqueue(
+        self, channel_id: int, key: Hashable, kind: str, target: Any, fields: dict[str, Any]
+    ) -> Any:
+        queue = self._channels.get(channel_id)
+        if queue is None:
+            queue = self._channels[channel_id] = _ChannelQueue()
+
+        request = queue.pending.get(key)
+        if request is not None:
+            # Last write wins: the waiting request goes out once with the newest fields
+            request.fields.update(fields)
+            self.superseded += 1
+        else:
+            request = queue.pending[key] = _Request(kind, target, fields)
+            self.queued += 1
+            self.max_depth = max(self.max_depth, self.depth)
+
+        queue.wake.set()
+        if queue.worker is None or queue.worker.done():
+            queue.worker = asyncio.create_task(self._drain(channel_id, queue))
+        # Shielded so a cancelled caller doesn't cancel a request others share
+        return await asyncio.shield(request.future)
+
+    async def _drain(self, channel_id: int, queue: _ChannelQueue) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while queue.pending:
+                while queue.pending:
+                    if len(queue.sent_at) == CHANNEL_RATE_LIMIT:
+                        await asyncio.sleep(queue.sent_at[0] + CHANNEL_RATE_PERIOD - loop.time())
+
+                    _, request = queue.pending.popitem(last=False)
+                    queue.sent_at.append(loop.time())
+                    try:
+                        result = await self._perform(request)
+                    except Exception as e:
+                        self.failed += 1
+                        request.future.set_exception(e)
+                    else:
+                        self.sent += 1
+                        request.future.set_result(result)
+
+                # Keep the channel's pacing history until it expires, in case more requests follow
+                queue.wake.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(
+                        queue.wake.wait(), queue.sent_at[-1] + CHANNEL_RATE_PERIOD - loop.time()
+                    )
+        finally:
+            if self._channels.get(channel_id) is queue:
+                del self._channels[channel_id]
+
+    @staticmethod
+    async def _perform(request: _Request) -> Any:
+        if request.kind == "send":
+            return await request.target.send(**request.fields)
+        if request.kind == "edit":
+            return await request.target.edit(**request.fields)
+        return await request.target.delete()
+
+    def close(self) -> None:
+        for queue in self._channels.values():
+            if queue.worker is not None:
+                queue.worker.cancel()
+            for request in queue.pending.values():
+                request.future.cancel()
+        self._channels.clear()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "depth": self.depth,
+            "max_depth": self.max_depth,
+            "queued": self.queued,
+            "sent": self.sent,
+            "superseded": self.superseded,
+            "failed": self.failed,
+        }
+
+
+OUTBOUND = OutboundMessages()
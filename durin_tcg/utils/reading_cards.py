@@ -1,42 +1,296 @@
 from __future__ import annotations
 
+import hashlib
 import importlib.util
+import itertools
+import json
+import os
 import pathlib
 import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib.abc import InspectLoader
+from typing import TYPE_CHECKING, Any
 
 from durin_tcg.config import CONFIG
+from durin_tcg.enums import CardElement, Game
 from durin_tcg.models.cards import Card
+from durin_tcg.utils.logger import LOGGER
+
+if TYPE_CHECKING:
+    from importlib.machinery import ModuleSpec
+    from types import CodeType, ModuleType
 
 CARD_ROOT = pathlib.Path(CONFIG.card_root)
+CARD_CATALOG_FILE = pathlib.Path(CONFIG.card_catalog_file)
+CATALOG_VERSION = 1
 
+# Attributes every class body gets, so a card class defining only these plus __init__ has no
+# custom behavior and can be rebuilt from its metadata alone
+_PLAIN_CLASS_ATTRS = {
+    "__module__",
+    "__qualname__",
+    "__doc__",
+    "__init__",
+    "__firstlineno__",
+    "__static_attributes__",
+}
+
+
+def _card_files() -> list[tuple[str, pathlib.Path]]:
+    return sorted(
+        (f"{subfolder.name}.{file.stem}", file)
+        for subfolder in CARD_ROOT.iterdir()
+        if subfolder.is_dir()
+        for file in subfolder.glob("*.py")
+    )
+
+
+def _compile_module(module_name: str, file: pathlib.Path) -> tuple[ModuleSpec, CodeType] | None:
+    spec = importlib.util.spec_from_file_location(module_name, file)
+    if spec is None or not isinstance(spec.loader, InspectLoader):
+        return None
+
+    # Reading the source and compiling it (or reading cached bytecode) is the part of an import
+    # that does not touch shared state, so this half may run on a worker thread.
+    code = spec.loader.get_code(module_name)
+    if code is None:
+        return None
+    return spec, code
+
+
+def _exec_module(spec: ModuleSpec, code: CodeType) -> ModuleType:
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    exec(code, module.__dict__)  # noqa: S102
+    return module
+
+
+def import_card_module(module_name: str, file: pathlib.Path) -> None:
+    """Import a card module under the name read_cards gave it, without creating its cards.
+
+    Card classes live in modules that aren't importable by name, so a process that unpickles
+    cards created by another one has to import their modules like this first.
+    """
+    if module_name in sys.modules:
+        return
+    compiled = _compile_module(module_name, file)
+    if compiled is None:
+        msg = f"Could not import card module {module_name!r} from {file}"
+        raise ImportError(msg)
+    _exec_module(*compiled)
+
+
+def _exec_cards(compiled: tuple[ModuleSpec, CodeType] | None) -> list[Card]:
+    if compiled is None:
+        return []
+
+    module = _exec_module(*compiled)
+
+    # Find the classes that inherit from Card
+    cards = []
+    for attr_name in dir(module):
+        attr = getattr(module, attr_name)
+        if (
+            isinstance(attr, type)
+            and issubclass(attr, Card)
+            and attr is not Card
+            and attr.__name__ not in {"GenshinCard", "HSRCard", "ZZZCard"}
+        ):
+            cards.append(attr())  # pyright: ignore[reportCallIssue]
+    return cards
+
+
+def _compile_modules(
+    modules: list[tuple[str, pathlib.Path]], workers: int
+) -> list[tuple[ModuleSpec, CodeType] | None]:
+    if workers <= 1 or len(modules) <= 1:
+        return list(itertools.starmap(_compile_module, modules))
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="card-loader") as pool:
+        return list(pool.map(_compile_module, *zip(*modules, strict=True)))
+
+
+def _card_metadata(card: Card) -> dict[str, str]:
+    return {
+        "name": card.name,
+        "desc": card.desc,
+        "game": card.game.value,
+        "element": card.element.value,
+    }
+
+
+def _card_from_metadata(metadata: dict[str, str]) -> Card:
+    return Card(
+        metadata["name"], metadata["desc"], Game(metadata["game"]), CardElement(metadata["element"])
+    )
+
+
+def _ability_signature(card: Card) -> tuple:
+    return tuple(
+        (a.name, a.desc, a.damage_type, a.damage_number, a.add_func, a.ability_type, a.cost)
+        for a in (card.basic, card.skill, card.ultimate)
+    )
+
+
+def _is_cacheable(card: Card) -> bool:
+    """Whether rebuilding the card from its metadata gives an identical card."""
+    # Behavior can come from any class between the card's own and Card, or from a mixin
+    for cls in type(card).__mro__:
+        if cls is not Card and cls is not object and set(vars(cls)) - _PLAIN_CLASS_ATTRS:
+            return False
+    rebuilt = _card_from_metadata(_card_metadata(card))
+    return vars(card).keys() == vars(rebuilt).keys() and _ability_signature(
+        card
+    ) == _ability_signature(rebuilt)
 
-def read_cards() -> dict[str, Card]:
-    all_cards: dict[str, Card] = {}
 
-    for subfolder in CARD_ROOT.iterdir():
-        if not subfolder.is_dir():
+def _file_hash(file: pathlib.Path) -> str:
+    return hashlib.sha256(file.read_bytes()).hexdigest()
+
+
+def _load_catalog() -> dict[str, Any]:
+    if not CARD_CATALOG_FILE.exists():
+        return {}
+    try:
+        catalog = json.loads(CARD_CATALOG_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        LOGGER.warning("Ignoring unreadable card catalog '%s'", CARD_CATALOG_FILE)
+        return {}
+    if catalog.get("version") != CATALOG_VERSION:
+        return {}
+    return catalog["modules"]
+
+
+def _save_catalog(modules: dict[str, Any]) -> None:
+    # A temporary file of its own per writer, since the bot and simulation workers may write
+    # the catalog at the same time; the last rename wins
+    fd, tmp_path = tempfile.mkstemp(
+        dir=CARD_CATALOG_FILE.parent, prefix=f".{CARD_CATALOG_FILE.name}."
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"version": CATALOG_VERSION, "modules": modules}, f, indent=2)
+        pathlib.Path(tmp_path).replace(CARD_CATALOG_FILE)
+    except BaseException:
+        pathlib.Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _unchanged_entry(entry: dict[str, Any] | None, file: pathlib.Path) -> dict[str, Any] | None:
+    """Return the module's catalog entry if the file is unchanged since it was written."""
+    if entry is None:
+        return None
+
+    stat = file.stat()
+    if (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+        return entry
+
+    # Touched but possibly unchanged (e.g. after a checkout), so fall back to the hash
+    if entry["sha256"] != _file_hash(file):
+        return None
+    return {**entry, "mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+
+
+def _scan_cards(
+    catalog: dict[str, Any], current: dict[str, Card] | None = None, workers: int = 0
+) -> tuple[dict[str, Card], dict[str, Any], int]:
+    """Load the cards of every module, importing only the ones that changed.
+
+    Cards of unchanged modules are taken from ``current`` when given, so existing card objects
+    are kept as they are, or else rebuilt from their catalog metadata when that is safe.
+    Changed modules are compiled on ``workers`` threads, then executed one by one in path
+    order, so the result does not depend on which thread finished first.
+    """
+    files = _card_files()
+    module_cards: dict[str, list[Card]] = {}
+    modules: dict[str, Any] = {}
+    to_import: list[tuple[str, pathlib.Path]] = []
+
+    for module_name, file in files:
+        key = file.relative_to(CARD_ROOT).as_posix()
+        entry = _unchanged_entry(catalog.get(key), file)
+        names = [metadata["name"] for metadata in entry["cards"]] if entry else []
+
+        if entry is not None and current is not None and all(name in current for name in names):
+            module_cards[key] = [current[name] for name in names]
+        elif entry is not None and entry["cacheable"]:
+            module_cards[key] = [_card_from_metadata(metadata) for metadata in entry["cards"]]
+        else:
+            to_import.append((module_name, file))
             continue
+        modules[key] = entry
 
-        for file in subfolder.glob("*.py"):
-            module_name = f"{subfolder.name}.{file.stem}"
-            spec = importlib.util.spec_from_file_location(module_name, file)
-            if spec is None or spec.loader is None:
+    for (_, file), compiled in zip(to_import, _compile_modules(to_import, workers), strict=True):
+        key = file.relative_to(CARD_ROOT).as_posix()
+        cards = _exec_cards(compiled)
+        stat = file.stat()
+        module_cards[key] = cards
+        modules[key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _file_hash(file),
+            "cacheable": all(_is_cacheable(card) for card in cards),
+            "cards": [_card_metadata(card) for card in cards],
+        }
+
+    all_cards: dict[str, Card] = {}
+    origins: dict[str, str] = {}
+    for key in sorted(module_cards):
+        for card_instance in module_cards[key]:
+            if card_instance.name in all_cards:
+                LOGGER.error(
+                    "Duplicate card name %r in '%s' (already defined in '%s'); keeping the first",
+                    card_instance.name,
+                    key,
+                    origins[card_instance.name],
+                )
                 continue
+            all_cards[card_instance.name] = card_instance
+            origins[card_instance.name] = key
+
+    return all_cards, dict(sorted(modules.items())), len(to_import)
+
 
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            spec.loader.exec_module(module)
-
-            # Find the class that inherits from Card
-            for attr_name in dir(module):
-                attr = getattr(module, attr_name)
-                if (
-                    isinstance(attr, type)
-                    and issubclass(attr, Card)
-                    and attr is not Card
-                    and attr.__name__ not in {"GenshinCard", "HSRCard", "ZZZCard"}
-                ):
-                    card_instance = attr()  # pyright: ignore[reportCallIssue]
-                    all_cards[card_instance.name] = card_instance
+def read_cards(
+    *, use_catalog: bool = True, workers: int = CONFIG.card_load_workers
+) -> dict[str, Card]:
+    """Load every card under ``CARD_ROOT``.
 
+    Modules that are unchanged since the catalog was written are rebuilt from their cached
+    metadata instead of being imported; everything else is imported and the catalog updated.
+    With ``workers`` > 1 the modules to import are compiled on a thread pool.
+    """
+    catalog = _load_catalog() if use_catalog else {}
+    all_cards, modules, imported = _scan_cards(catalog, workers=workers)
+
+    if modules != catalog:
+        _save_catalog(modules)
+
+    LOGGER.info(
+        "Loaded %d cards (%d of %d modules imported, the rest from the catalog)",
+        len(all_cards),
+        imported,
+        len(modules),
+    )
     return all_cards
+
+
+def reload_cards(current: dict[str, Card]) -> dict[str, Card]:
+    """Build a new card mapping, re-importing only modules changed since the last load.
+
+    Cards from unchanged modules are the same objects as in ``current``; ``current`` itself is
+    left untouched, so anything still holding it (or its cards) keeps working unchanged.
+    """
+    all_cards, modules, imported = _scan_cards(
+        _load_catalog(), current, workers=CONFIG.card_load_workers
+    )
+    _save_catalog(modules)
+
+    LOGGER.info("Reloaded cards: %d of %d modules re-imported", imported, len(modules))
+    return all_cards
+
+
+if __name__ == "__main__":
+    # Build step: import every card module and write a fresh catalog
+    read_cards(use_catalog=False)
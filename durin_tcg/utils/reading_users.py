@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 import pathlib
+import tempfile
 
 from durin_tcg.config import CONFIG
 from durin_tcg.models.user import TCGUser
@@ -12,10 +14,22 @@ USER_DATA_FILE = pathlib.Path(CONFIG.user_data_file)
 def load_all_users() -> dict[str, TCGUser]:
     if not USER_DATA_FILE.exists():
         return {}
-    raw_data = json.loads(USER_DATA_FILE.read_text())
+    raw_data = json.loads(USER_DATA_FILE.read_text(encoding="utf-8"))
     return {uid: TCGUser(**data) for uid, data in raw_data.items()}
 
 
 def save_all_users(users: dict[str, TCGUser]) -> None:
     raw = {uid: user.model_dump(mode="json") for uid, user in users.items()}
-    USER_DATA_FILE.write_text(json.dumps(raw, indent=4))
+
+    # Write to a temporary file first and rename it over the old one, so a crash mid-write
+    # never leaves a truncated user file behind.
+    fd, tmp_path = tempfile.mkstemp(dir=USER_DATA_FILE.parent, prefix=f".{USER_DATA_FILE.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(raw, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
+        pathlib.Path(tmp_path).replace(USER_DATA_FILE)
+    except BaseException:
+        pathlib.Path(tmp_path).unlink(missing_ok=True)
+        raise
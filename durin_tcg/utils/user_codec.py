@@ -0,0 +1,133 @@
+"""
+Compact binary encoding for TCGUser records.
+
+Layout (all integers little-endian)::
+
+    header   magic b"DU" | version: u8
+    user     currency: i64 | card_pity: i32 | active_deck_index: i32 | start_date: i64 (microseconds, UTC)
+             owned_cards: u16 byte length + bitset of card ids
+                          (version 1: u16 count + u16 card ids)
+             decks: u16 count, each: name (u16 length + UTF-8) | u16 count + u16 card ids
+             card_settings: u16 count, each: u16 card id | frame (u16 length + UTF-8)
+
+Card ids come from the card registry, which the user store persists next to the records so
+the ids stay stable.
+"""
+
+from __future__ import annotations
+
+import struct
+from datetime import UTC, datetime, timedelta
+
+from durin_tcg.models.card_registry import CARD_REGISTRY, CardSet
+from durin_tcg.models.user import TCGUser
+
+MAGIC = b"DU"
+VERSION = 2
+
+_HEADER = struct.Struct("<2sB")
+_USER = struct.Struct("<qiiq")
+_COUNT = struct.Struct("<H")
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+
+
+def is_encoded(data: bytes | str) -> bool:
+    return isinstance(data, bytes) and data[:2] == MAGIC
+
+
+def _pack_ids(parts: list[bytes], ids: list[int]) -> None:
+    parts.append(struct.pack(f"<H{len(ids)}H", len(ids), *ids))
+
+
+def _pack_str(parts: list[bytes], value: str) -> None:
+    raw = value.encode()
+    parts.extend((_COUNT.pack(len(raw)), raw))
+
+
+def encode_user(user: TCGUser) -> bytes:
+    register = CARD_REGISTRY.register
+    start_us = (user.start_date - _EPOCH) // timedelta(microseconds=1)
+    owned_bits = user.owned_cards.bits
+
+    parts = [
+        _HEADER.pack(MAGIC, VERSION),
+        _USER.pack(user.currency, user.card_pity, user.active_deck_index, start_us),
+    ]
+    owned_bytes = owned_bits.to_bytes((owned_bits.bit_length() + 7) // 8, "little")
+    parts.extend((_COUNT.pack(len(owned_bytes)), owned_bytes))
+
+    parts.append(_COUNT.pack(len(user.decks)))
+    for deck in user.decks:
+        _pack_str(parts, deck.name)
+        _pack_ids(parts, [register(card) for card in deck.cards])
+
+    parts.append(_COUNT.pack(len(user.card_settings)))
+    for settings in user.card_settings:
+        parts.append(_COUNT.pack(register(settings.card_name)))
+        _pack_str(parts, settings.card_frame)
+
+    return b"".join(parts)
+
+
+def decode_user(data: bytes) -> TCGUser:
+    """Decode a record written by ``encode_user``.
+
+    The decoded fields are handed to Pydantic in a single ``model_validate`` call. Validating
+    the nested dicts in pydantic-core is as fast as ``model_construct`` on each sub-model, so
+    there is no separate unvalidated path.
+    """
+    magic, version = _HEADER.unpack_from(data)
+    if magic != MAGIC or version not in {1, VERSION}:
+        msg = f"Unsupported user record (magic={magic!r}, version={version})"
+        raise ValueError(msg)
+
+    unpack_from = struct.unpack_from
+    name = CARD_REGISTRY.name_of
+    offset = _HEADER.size
+
+    currency, card_pity, active_deck_index, start_us = _USER.unpack_from(data, offset)
+    offset += _USER.size
+
+    (n,) = unpack_from("<H", data, offset)
+    if version == 1:
+        owned_cards = CardSet(
+            bits=sum(1 << i for i in set(unpack_from(f"<{n}H", data, offset + 2)))
+        )
+        offset += 2 + 2 * n
+    else:
+        owned_cards = CardSet(bits=int.from_bytes(data[offset + 2 : offset + 2 + n], "little"))
+        offset += 2 + n
+
+    decks = []
+    (deck_count,) = unpack_from("<H", data, offset)
+    offset += 2
+    for _ in range(deck_count):
+        (n,) = unpack_from("<H", data, offset)
+        deck_name = data[offset + 2 : offset + 2 + n].decode()
+        offset += 2 + n
+        (n,) = unpack_from("<H", data, offset)
+        cards = [name(card_id) for card_id in unpack_from(f"<{n}H", data, offset + 2)]
+        offset += 2 + 2 * n
+        decks.append({"name": deck_name, "cards": cards})
+
+    card_settings = []
+    (settings_count,) = unpack_from("<H", data, offset)
+    offset += 2
+    for _ in range(settings_count):
+        card_id, n = unpack_from("<HH", data, offset)
+        frame = data[offset + 4 : offset + 4 + n].decode()
+        offset += 4 + n
+        card_settings.append({"card_name": name(card_id), "card_frame": frame})
+
+    return TCGUser.model_validate(
+        {
+            "owned_cards": owned_cards,
+            "decks": decks,
+            "active_deck_index": active_deck_index,
+            "currency": currency,
+            "card_settings": card_settings,
+            "start_date": _EPOCH + timedelta(microseconds=start_us),
+            "card_pity": card_pity,
+        }
+    )
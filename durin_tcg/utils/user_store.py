@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import json
+import pathlib
+import sqlite3
+import threading
+from typing import TYPE_CHECKING, Any
+
+from durin_tcg.config import CONFIG
+from durin_tcg.enums import UserChange
+from durin_tcg.models.card_registry import CARD_REGISTRY
+from durin_tcg.models.user import CardDeck, TCGUser
+from durin_tcg.utils.logger import LOGGER
+from durin_tcg.utils.reading_users import USER_DATA_FILE, load_all_users
+from durin_tcg.utils.user_codec import decode_user, encode_user, is_encoded
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+USER_DB_FILE = pathlib.Path(CONFIG.user_db_file)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    user_id TEXT PRIMARY KEY,
+    data BLOB NOT NULL
+);
+CREATE TABLE IF NOT EXISTS card_names (
+    card_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS journal (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    op TEXT NOT NULL,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS journal_user_id ON journal (user_id);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_JSON_MIGRATED_KEY = "json_migrated_from"
+
+type Change = tuple[str, UserChange, Any]
+
+
+def apply_change(user: TCGUser | None, op: UserChange, payload: Any) -> TCGUser:
+    """Apply a single journaled change to a user and return the resulting user."""
+    if op in {UserChange.CREATE, UserChange.REPLACE}:
+        return TCGUser(**payload)
+
+    if user is None:
+        msg = f"Cannot apply '{op}' to a user without a snapshot"
+        raise ValueError(msg)
+
+    if op == UserChange.CURRENCY:
+        user.currency += payload
+    elif op == UserChange.CARD:
+        user.owned_cards.add(payload)
+    elif op == UserChange.DECK_SET:
+        deck = CardDeck(**payload["deck"])
+        if payload["index"] == len(user.decks):
+            user.decks.append(deck)
+        else:
+            user.decks[payload["index"]] = deck
+    elif op == UserChange.DECK_DELETE:
+        user.decks.pop(payload)
+    elif op == UserChange.ACTIVE_DECK:
+        user.active_deck_index = payload
+
+    return user
+
+
+class UserStore:
+    """SQLite-backed user storage with one snapshot row per user plus a change journal.
+
+    Mutations are appended to the journal as small per-user deltas, so a write costs as much as
+    the change rather than the whole user. The journal is periodically compacted back into the
+    snapshot rows, and loading replays whatever journal entries have not been compacted yet.
+    Every write is a single SQLite transaction in WAL mode, so a crash mid-write leaves either
+    the old or the new state on disk, never a truncated one.
+    """
+
+    def __init__(self, path: pathlib.Path = USER_DB_FILE) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        # Point lookups come from both the event loop and the store executor, so each thread
+        # reads through a connection of its own; WAL lets them read alongside an open write
+        # transaction. Only close() touches another thread's connection.
+        self._local = threading.local()
+        self._readers: list[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self.journal_size: int = self._conn.execute("SELECT COUNT(*) FROM journal").fetchone()[0]
+        CARD_REGISTRY.load(self._conn.execute("SELECT card_id, name FROM card_names"))
+
+    @property
+    def _reader(self) -> sqlite3.Connection:
+        reader: sqlite3.Connection | None = getattr(self._local, "reader", None)
+        if reader is None:
+            reader = self._local.reader = sqlite3.connect(self.path, check_same_thread=False)
+            with self._readers_lock:
+                self._readers.append(reader)
+        return reader
+
+    def _decode(self, data: bytes | str) -> TCGUser:
+        # Rows written before the binary format are still JSON text
+        if is_encoded(data):
+            return decode_user(data)  # pyright: ignore[reportArgumentType]
+        return TCGUser(**json.loads(data))
+
+    def _save_card_ids(self) -> int:
+        """Write card ids registered since the last save; call inside the writing transaction.
+
+        Returns how many were written, to be passed to ``CARD_REGISTRY.mark_saved`` once the
+        transaction has committed.
+        """
+        unsaved = CARD_REGISTRY.unsaved()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO card_names (card_id, name) VALUES (?, ?)", unsaved
+        )
+        return len(unsaved)
+
+    def save_card_ids(self) -> None:
+        with self._conn:
+            saved = self._save_card_ids()
+        CARD_REGISTRY.mark_saved(saved)
+
+    def has_user(self, user_id: str) -> bool:
+        return (
+            self._reader.execute("SELECT 1 FROM users WHERE user_id = ?", (user_id,)).fetchone()
+            is not None
+            or self._reader.execute(
+                "SELECT 1 FROM journal WHERE user_id = ? LIMIT 1", (user_id,)
+            ).fetchone()
+            is not None
+        )
+
+    def load_user(self, user_id: str) -> TCGUser | None:
+        """Hydrate one user from its snapshot row plus its journal entries."""
+        row = self._reader.execute(
+            "SELECT data FROM users WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        user = self._decode(row[0]) if row else None
+
+        for op, payload in self._reader.execute(
+            "SELECT op, payload FROM journal WHERE user_id = ? ORDER BY seq", (user_id,)
+        ):
+            user = apply_change(user, UserChange(op), json.loads(payload))
+
+        return user
+
+    def append_changes(self, changes: Iterable[Change]) -> None:
+        rows = [(uid, op.value, json.dumps(payload)) for uid, op, payload in changes]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO journal (user_id, op, payload) VALUES (?, ?, ?)", rows
+            )
+        self.journal_size += len(rows)
+
+    def save_user(self, user_id: str, user: TCGUser) -> None:
+        """Write a full snapshot of one user and drop its now redundant journal entries."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO users (user_id, data) VALUES (?, ?)",
+                (user_id, encode_user(user)),
+            )
+            saved = self._save_card_ids()
+            deleted = self._conn.execute("DELETE FROM journal WHERE user_id = ?", (user_id,))
+        CARD_REGISTRY.mark_saved(saved)
+        self.journal_size -= deleted.rowcount
+
+    def compact(self) -> int:
+        """Fold the journal into the snapshot rows and return how many users were rewritten."""
+        with self._conn:
+            entries = self._conn.execute(
+                "SELECT seq, user_id, op, payload FROM journal ORDER BY seq"
+            ).fetchall()
+            if not entries:
+                return 0
+
+            touched: dict[str, TCGUser | None] = {}
+            for _, uid, _, _ in entries:
+                if uid not in touched:
+                    row = self._conn.execute(
+                        "SELECT data FROM users WHERE user_id = ?", (uid,)
+                    ).fetchone()
+                    touched[uid] = self._decode(row[0]) if row else None
+
+            for _, uid, op, payload in entries:
+                touched[uid] = apply_change(touched[uid], UserChange(op), json.loads(payload))
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO users (user_id, data) VALUES (?, ?)",
+                [(uid, encode_user(user)) for uid, user in touched.items() if user],
+            )
+            saved = self._save_card_ids()
+            self._conn.execute("DELETE FROM journal WHERE seq <= ?", (entries[-1][0],))
+
+        CARD_REGISTRY.mark_saved(saved)
+        self.journal_size = 0
+        return len(touched)
+
+    def migrate_from_json(self) -> None:
+        """Import users from the legacy JSON file once.
+
+        The migration is recorded in the ``meta`` table, so later edits to the JSON file are
+        ignored. The file itself is left untouched as a backup.
+        """
+        migrated = self._conn.execute(
+            "SELECT value FROM meta WHERE key = ?", (_JSON_MIGRATED_KEY,)
+        ).fetchone()
+        if migrated is not None or not USER_DATA_FILE.exists():
+            return
+
+        users = load_all_users()
+        with self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO users (user_id, data) VALUES (?, ?)",
+                [(uid, encode_user(user)) for uid, user in users.items()],
+            )
+            saved = self._save_card_ids()
+            self._conn.execute(
+                "INSERT INTO meta (key, value) VALUES (?, ?)",
+                (_JSON_MIGRATED_KEY, str(USER_DATA_FILE)),
+            )
+        CARD_REGISTRY.mark_saved(saved)
+
+        LOGGER.info("Migrated %d users from '%s' to '%s'", len(users), USER_DATA_FILE, self.path)
+
+    def close(self) -> None:
+        with self._readers_lock:
+            for reader in self._readers:
+                reader.close()
+            self._readers.clear()
+        self._conn.close()
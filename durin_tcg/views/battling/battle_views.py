@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import datetime
 from abc import ABC, abstractmethod
+from concurrent.futures.process import BrokenProcessPool
 from typing import TYPE_CHECKING, Literal
 
 import discord
@@ -10,11 +12,20 @@ from discord.ui import Button
 
 from durin_tcg.constants import EMBED_TIMEOUT, TURN_TIME_LIMIT
 from durin_tcg.enums import CardAbility
+from durin_tcg.exceptions import AIServiceBusyError, IllegalActionError
+from durin_tcg.models.ai_search import choose_turn
+from durin_tcg.models.battle_state import SWITCH_ACTION, BattleState, action_for
+from durin_tcg.utils.deadlines import DEADLINES
+from durin_tcg.utils.logger import LOGGER
+from durin_tcg.utils.outbound import OUTBOUND
 from durin_tcg.views.base import BaseView
 
 if TYPE_CHECKING:
+    from discord.types.embed import Embed as EmbedData
+
     from durin_tcg.models.game import Battle, Player
     from durin_tcg.models.game_data import GameData
+    from durin_tcg.utils.ai_move_service import AIMoveService
 
 
 class BattleView(BaseView, ABC):
@@ -32,9 +43,14 @@ class BattleView(BaseView, ABC):
         self.game = game
         self.game_data = game_data
 
-        self.challenger_turn = True  # challenger starts
         self.message: discord.Message | None = None
-        self.turn_task: asyncio.Task | None = None
+        self.turn_deadline = discord.utils.utcnow()
+        # Whose turn it is and the team embeds when the deadline was last set
+        self.timed_state: tuple[bool, list[EmbedData]] | None = None
+        # What the message shows, as content and embed dicts, and the render in progress
+        self.rendered: tuple[str, list[EmbedData]] | None = None
+        self.render_task: asyncio.Task | None = None
+        self.render_stale = False
 
         self.add_item(BattleActionButton("Basic Attack", CardAbility.BASIC))
         self.add_item(BattleActionButton("Skill", CardAbility.SKILL))
@@ -42,6 +58,15 @@ class BattleView(BaseView, ABC):
 
         self.add_item(SwitchCharacterButton())
 
+    @property
+    def challenger_turn(self) -> bool:
+        # The challenger is always player 1
+        return self.game.player1_turn
+
+    @challenger_turn.setter
+    def challenger_turn(self, value: bool) -> None:
+        self.game.player1_turn = value
+
     def current_user(self) -> discord.User | discord.Member | str:
         return self.challenger if self.challenger_turn else self.opponent
 
@@ -51,96 +76,154 @@ class BattleView(BaseView, ABC):
     def enemy_player(self) -> Player:
         return self.game.player2 if self.challenger_turn else self.game.player1
 
+    def player_of(self, user: discord.User | discord.Member) -> Player | None:
+        """The side ``user`` plays in this battle, if any."""
+        if user.id == self.challenger.id:
+            return self.game.player1
+        if not isinstance(self.opponent, str) and user.id == self.opponent.id:
+            return self.game.player2
+        return None
+
+    def build_embeds(self) -> list[discord.Embed]:
+        opponent_name = (
+            self.opponent if isinstance(self.opponent, str) else self.opponent.display_name
+        )
+        return [
+            self.build_embed(self.challenger.display_name, self.game.player1),
+            self.build_embed(opponent_name, self.game.player2),
+        ]
+
     def build_embed(self, title: str, player: Player) -> discord.Embed:
         embed = discord.Embed(title=title)
         embed.add_field(name="", value=self.get_team_info_text(player), inline=False)
         return embed
 
     def get_team_info_text(self, player: Player) -> str:
-        char_strings = []
-        for char in player.deck:
-            afflicted_elements_str = ", ".join(char.afflicted_elements)
-            char_strings.append(
-                f"{char.card.name} (HP: {char.current_hp})"
-                + (afflicted_elements_str if char.afflicted_elements else "")
-                + (" [Active]" if char == player.active_character else "")
-            )
-        return "\n".join(char_strings)
-
-    async def update_ui(
-        self, interaction: discord.Interaction, message: discord.Message | None = None
-    ) -> None:
-        message = message or self.message
-        channel = message.channel if message else interaction.channel
-
-        if message:
-            with contextlib.suppress(discord.NotFound):
-                await message.delete()
-
-        user1_embed = self.build_embed(self.challenger.display_name, self.game.player1)
-
-        opponent_name = (
-            self.opponent if isinstance(self.opponent, str) else self.opponent.display_name
+        # The aura mask holds at most a couple of elements, so this stays short however long
+        # the battle runs
+        return f"Action points: {player.action_points}\n" + "\n".join(
+            f"{char.card.name} (HP: {char.current_hp})"
+            + (f" [{', '.join(char.afflicted_elements)}]" if char.auras else "")
+            + (" [Active]" if char == player.active_character else "")
+            for char in player.deck
         )
-        user2_embed = self.build_embed(opponent_name, self.game.player2)
 
-        new_message = await channel.send(
-            content=f"It's {self.current_user()}'s turn - {TURN_TIME_LIMIT} seconds left!",
-            embeds=[user1_embed, user2_embed],
-            view=self,
-        )
+    def turn_prompt(self) -> str:
+        # Discord counts a relative timestamp down on its own, so the prompt is rendered once
+        deadline = discord.utils.format_dt(self.turn_deadline, style="R")
+        prompt = f"It's {self.current_user()}'s turn - time runs out {deadline}!"
+        if self.current_player().active_character.current_hp <= 0:
+            prompt += " Their active character was knocked out, switch to another one first."
+        return prompt
 
-        self.message = new_message
+    async def update_ui(self, interaction: discord.Interaction) -> None:
+        """Start the next turn's timer and show the battle.
 
+        Updates that arrive while the message is being sent or edited are coalesced into one
+        more render of the latest state once that call returns.
+        """
         self.start_turn_timer()
+        channel = interaction.channel
+        # Buttons only live on messages, and a message's channel can always be sent to
+        if not isinstance(channel, discord.abc.Messageable):
+            return
 
-    def start_turn_timer(self) -> None:
-        if self.turn_task and not self.turn_task.done():
-            self.turn_task.cancel()
+        self.render_stale = True
+        if self.render_task is None or self.render_task.done():
+            self.render_task = asyncio.create_task(self.render(channel))
+        # Shielded so a cancelled caller doesn't abort a render other callers wait on
+        await asyncio.shield(self.render_task)
 
-        self.turn_task = asyncio.create_task(self.turn_timer())
+    async def render(self, channel: discord.abc.Messageable) -> None:
+        while self.render_stale:
+            self.render_stale = False
 
-    async def turn_timer(self) -> None:
-        try:
-            for remaining in range(TURN_TIME_LIMIT, 0, -1):
-                await asyncio.sleep(1)
-
-                if self.message:
-                    await self.message.edit(
-                        content=f"It's {self.current_user()}'s turn - {remaining} seconds left!",
-                        view=self,
-                    )
-        except asyncio.CancelledError:
-            return
+            embeds = self.build_embeds()
+            rendered = (self.turn_prompt(), [embed.to_dict() for embed in embeds])
+            if rendered == self.rendered:
+                continue
+
+            await self.show(channel, rendered[0], embeds)
+            self.rendered = rendered
+
+    async def show(
+        self, channel: discord.abc.Messageable, content: str, embeds: list[discord.Embed]
+    ) -> None:
+        """Edit the battle message in place while it is the newest one in its channel, and
+        otherwise move it to the bottom so the buttons stay in view."""
+        old = self.message
+        if old is not None and getattr(old.channel, "last_message_id", None) == old.id:
+            try:
+                self.message = await OUTBOUND.edit(old, content=content, embeds=embeds, view=self)
+            except discord.NotFound:
+                pass
+            else:
+                return
+
+        self.message = await OUTBOUND.send(
+            old.channel if old else channel, content=content, embeds=embeds, view=self
+        )
+        if old is not None:
+            with contextlib.suppress(discord.NotFound):
+                await OUTBOUND.delete(old)
 
+    def start_turn_timer(self) -> None:
+        # An update that changes nothing on screen keeps the deadline already shown, so the
+        # countdown stays true and render() finds nothing to edit
+        now = discord.utils.utcnow()
+        state = (self.challenger_turn, [embed.to_dict() for embed in self.build_embeds()])
+        if state != self.timed_state:
+            self.timed_state = state
+            self.turn_deadline = now + datetime.timedelta(seconds=TURN_TIME_LIMIT)
+        DEADLINES.schedule(self, (self.turn_deadline - now).total_seconds(), self.expire_turn)
+
+    async def expire_turn(self) -> None:
         if self.message:
             with contextlib.suppress(discord.NotFound):
-                await self.message.edit(
-                    content="Time's up! The battle has ended due to inactivity.", view=None
+                await OUTBOUND.edit(
+                    self.message,
+                    content="Time's up! The battle has ended due to inactivity.",
+                    view=None,
                 )
         self.stop()
 
     async def take_turn(self, ability: CardAbility, interaction: discord.Interaction) -> None:
-        if self.turn_task and not self.turn_task.done():
-            self.turn_task.cancel()
+        if self.player_of(interaction.user) is not self.current_player():
+            await interaction.response.send_message("It's not your turn!", ephemeral=True)
+            return
+
+        try:
+            self.game.step(action_for(ability))
+        except IllegalActionError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
 
-        self.current_player().use_ability(ability, self.enemy_player())
+        DEADLINES.cancel(self)
 
-        if self.enemy_player().active_character.current_hp <= 0:
+        if self.game.is_over:
             await self.end_battle(interaction)
             return
 
-        self.challenger_turn = not self.challenger_turn
-
         await interaction.response.defer()
 
-        await self.update_ui(interaction, self.message)
+        await self.update_ui(interaction)
 
     async def end_battle(self, interaction: discord.Interaction) -> None:
-        if self.turn_task and not self.turn_task.done():
-            self.turn_task.cancel()
-
-        await interaction.response.edit_message(content="someone won. not me though :(", view=None)
+        DEADLINES.cancel(self)
+
+        winner = self.game.winner
+        if winner is None:
+            content = f"The battle ended in a draw after {self.game.turns_played} turns."
+        else:
+            user = self.challenger if winner is self.game.player1 else self.opponent
+            content = f"🏆 {user} won the battle!"
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        # The clicked message may be an older one that show() has since replaced. Going through
+        # OUTBOUND also merges this into any turn update of the message still waiting there
+        if self.message:
+            with contextlib.suppress(discord.NotFound):
+                await OUTBOUND.edit(self.message, content=content, view=None)
         self.stop()
 
 
@@ -157,9 +240,75 @@ class PlayerBattleView(BattleView):
 
 class AIBattleView(BattleView):
     def __init__(
-        self, challenger: discord.User | discord.Member, game: Battle, game_data: GameData
+        self,
+        challenger: discord.User | discord.Member,
+        game: Battle,
+        game_data: GameData,
+        ai_moves: AIMoveService,
     ) -> None:
         super().__init__(challenger, "AI", game, game_data)
+        self.ai_moves = ai_moves
+
+    async def take_turn(self, ability: CardAbility, interaction: discord.Interaction) -> None:
+        if not self.challenger_turn:
+            await interaction.response.send_message("The AI is still thinking!", ephemeral=True)
+            return
+
+        await super().take_turn(ability, interaction)
+        if not self.is_finished() and not self.challenger_turn:
+            await self.play_ai_turn(interaction)
+
+    async def update_ui(self, interaction: discord.Interaction) -> None:
+        # The buttons are greyed out while the AI takes its turn
+        for child in self.children:
+            if isinstance(child, Button):
+                child.disabled = not self.challenger_turn
+        await super().update_ui(interaction)
+
+    async def play_ai_turn(self, interaction: discord.Interaction) -> None:
+        state = BattleState.from_battle(self.game)
+
+        try:
+            switch, action, result = await self.ai_moves.choose_turn(state)
+        except (AIServiceBusyError, TimeoutError, BrokenProcessPool):
+            # Fall back to a one ply search, which is instant, rather than stalling the battle
+            LOGGER.warning("AI move service unavailable, playing a shallow move instead")
+            switch, action, result = choose_turn(state, time_limit=0, node_budget=0)
+
+        if self.is_finished():
+            return
+        state = BattleState.from_battle(self.game)
+        if not is_playable(state, switch, action):
+            LOGGER.warning("The battle changed while the AI was thinking, choosing again")
+            switch, action, result = choose_turn(state, time_limit=0, node_budget=0)
+
+        LOGGER.debug(
+            "AI searched %d nodes to depth %d in %.3fs (%.0f nodes/s)",
+            result.nodes,
+            result.depth,
+            result.elapsed,
+            result.nodes_per_second,
+        )
+
+        if switch is not None:
+            self.game.step(SWITCH_ACTION + switch)
+        self.game.step(action)
+
+        if self.game.is_over:
+            await self.end_battle(interaction)
+            return
+
+        await self.update_ui(interaction)
+
+
+def is_playable(state: BattleState, switch: int | None, action: int) -> bool:
+    """Whether the turn ``choose_turn`` picked is still legal in ``state``."""
+    if switch is not None:
+        if SWITCH_ACTION + switch not in state.legal_actions():
+            return False
+        state = state.clone()
+        state.apply(SWITCH_ACTION + switch)
+    return action in state.legal_actions()
 
 
 class BattleActionButton(Button):
@@ -179,22 +328,28 @@ class SwitchCharacterButton(Button):
     async def callback(self, interaction: discord.Interaction) -> None:
         view: BattleView = self.view  # pyright: ignore[reportAssignmentType]
 
-        character_select_view = CharacterSelectView(view)
+        player = view.player_of(interaction.user)
+        if player is None:
+            await interaction.response.send_message("You're not in this battle!", ephemeral=True)
+            return
+
+        character_select_view = CharacterSelectView(view, interaction.user, player)
         await interaction.response.send_message(
             content="Choose a character to switch to:", view=character_select_view, ephemeral=True
         )
 
 
 class CharacterSelectView(BaseView):
-    def __init__(self, battle_view: BattleView) -> None:
+    def __init__(
+        self, battle_view: BattleView, user: discord.User | discord.Member, player: Player
+    ) -> None:
         super().__init__(timeout=EMBED_TIMEOUT)
         self.battle_view = battle_view
-        self.player = (
-            battle_view.game.player1 if battle_view.challenger_turn else battle_view.game.player2
-        )
+        self.user = user
+        self.player = player
 
         for i, char in enumerate(self.player.deck):
-            if char != self.player.active_character:
+            if char != self.player.active_character and char.current_hp > 0:
                 self.add_item(SingleCharacterButton(index=i, char_name=char.card.name))
 
 
@@ -208,7 +363,18 @@ class SingleCharacterButton(Button):
         battle_view = view.battle_view
         player = view.player
 
-        player.switch_character(self.index)
+        if interaction.user.id != view.user.id:
+            await interaction.response.send_message("This isn't your battle!", ephemeral=True)
+            return
+        if player is not battle_view.current_player():
+            await interaction.response.send_message("It's not your turn anymore!", ephemeral=True)
+            return
+
+        try:
+            battle_view.game.step(SWITCH_ACTION + self.index)
+        except IllegalActionError as e:
+            await interaction.response.send_message(str(e), ephemeral=True)
+            return
 
         await interaction.response.send_message(
             f"Switched to {player.active_character.card.name}!", ephemeral=True
@@ -8,6 +8,7 @@ from discord import Embed, Interaction
 from discord.ui import Button, Select
 
 from durin_tcg.constants import EMBED_TIMEOUT
+from durin_tcg.utils.outbound import OUTBOUND
 from durin_tcg.views.base import BaseView
 
 if TYPE_CHECKING:
@@ -90,8 +91,11 @@ class ConfirmSwitchDeckButton(Button):
         view.battle_command.switch_deck(view.user, view.selected_deck_index)
 
         with contextlib.suppress(discord.NotFound):
-            await interaction.message.edit(  # pyright: ignore[reportOptionalMemberAccess]
-                content="Deck switched successfully!", view=None, embed=None
+            await OUTBOUND.edit(
+                interaction.message,  # pyright: ignore[reportArgumentType]
+                content="Deck switched successfully!",
+                view=None,
+                embed=None,
             )
 
         with contextlib.suppress(discord.InteractionResponded):
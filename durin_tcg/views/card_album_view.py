@@ -6,33 +6,32 @@ import discord
 from discord.ui import View
 
 if TYPE_CHECKING:
-    from durin_tcg.models.cards import Card
+    from collections.abc import Iterable
+
+    from durin_tcg.utils.card_embeds import CardEmbedCache
 
 
 class CardAlbumPaginator(View):
     def __init__(
-        self, user_cards: list[str], card_lookup: dict[str, Card], timeout: int = 60
+        self,
+        user_cards: Iterable[str],
+        card_embeds: CardEmbedCache,
+        locale: discord.Locale,
+        timeout: int = 60,
     ) -> None:
         super().__init__(timeout=timeout)
         self.user_cards = list(user_cards)
-        self.card_lookup = card_lookup
+        self.card_embeds = card_embeds
+        self.locale = locale
         self.index: int = 0
 
         self._update_buttons()
 
     def _get_embed(self) -> discord.Embed:
-        current_card = self.card_lookup[self.user_cards[self.index]]
-
-        embed = discord.Embed(
-            title=current_card.name, description=f"Card {self.index + 1}/{len(self.user_cards)}"
+        return self.card_embeds.album(
+            self.user_cards[self.index], self.locale, self.index, len(self.user_cards)
         )
 
-        embed.add_field(name="Basic Attack", value=current_card.basic.desc, inline=False)
-        embed.add_field(name="Skill", value=current_card.skill.desc, inline=False)
-        embed.add_field(name="Ultimate", value=current_card.ultimate.desc, inline=False)
-
-        return embed
-
     def _update_buttons(self) -> None:
         self.first.disabled = self.index == 0
         self.prev.disabled = self.index == 0
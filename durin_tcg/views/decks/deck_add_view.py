@@ -11,13 +11,15 @@ from durin_tcg.models.user import CardDeck
 from durin_tcg.views.base import BaseView
 
 if TYPE_CHECKING:
+    from collections.abc import Collection
+
     from durin_tcg.models.game_data import GameData
 
 
 class DeckAddView(BaseView):
     def __init__(
         self,
-        user_cards: list[str],
+        user_cards: Collection[str],
         user_id: str,
         game_data: GameData,
         timeout: float = EMBED_TIMEOUT,
@@ -137,8 +139,9 @@ class ConfirmCancelView(View):
             self.parent.stop()
             return
 
-        user.decks.append(CardDeck(name=self.parent.deck_name, cards=self.parent.selected))
-        self.parent.game_data.save_users()
+        self.parent.game_data.add_deck(
+            self.parent.user_id, CardDeck(name=self.parent.deck_name, cards=self.parent.selected)
+        )
 
         await interaction.response.edit_message(
             content=f"Deck `{self.parent.deck_name}`created with: `{', '.join(self.parent.selected)}`",
@@ -47,12 +47,9 @@ class DeleteDeckSelect(Select):
 
     async def callback(self, interaction: Interaction) -> None:
         index = int(self.values[0])
-        user = self.parent_view.game_data.get_user(self.parent_view.user_id)
-        deck = user.decks[index]
+        deck = self.parent_view.game_data.delete_deck(self.parent_view.user_id, index)
 
         card_list = ", ".join(deck.cards)
-        user.decks.pop(index)
-        self.parent_view.game_data.save_users()
 
         await interaction.response.edit_message(
             content=f"Deleted Deck {index + 1}:\n`{card_list}`", view=None
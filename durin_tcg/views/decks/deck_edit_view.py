@@ -95,7 +95,7 @@ class EditableCharacterSelect(Select):
         self.parent_view = parent_view
 
         user_cards = parent_view.user.owned_cards
-        selected = selected_char or (user_cards[0] if user_cards else "")
+        selected = selected_char or next(iter(user_cards), "")
 
         options = [
             SelectOption(label=name, value=name, default=(name == selected)) for name in user_cards
@@ -164,9 +164,12 @@ class SaveChangesButton(Button):
             )
             return
 
-        self.parent_view.deck.cards = selected_chars
-        self.parent_view.deck.name = self.parent_view.deck_name
-        self.parent_view.game_data.save_users()
+        self.parent_view.game_data.update_deck(
+            self.parent_view.user_id,
+            self.parent_view.deck_index,
+            name=self.parent_view.deck_name,
+            cards=selected_chars,
+        )
 
         for select in self.parent_view.character_selects:
             select.disabled = True
@@ -3,7 +3,8 @@ from __future__ import annotations
 from durin_tcg.bot import DurinBot
 from durin_tcg.config import CONFIG
 
-bot = DurinBot()
+# AI worker processes re-import this module, so only the parent process may start the bot
+if __name__ == "__main__":
+    bot = DurinBot()
 
-
-bot.run(CONFIG.discord_token)
+    bot.run(CONFIG.discord_token)
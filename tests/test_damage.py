@@ -0,0 +1,102 @@
+"""
+The damage pipeline that BattleState.apply runs every attack through.
+
+Run from the repository root: python -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import unittest
+from typing import TYPE_CHECKING
+
+from durin_tcg.constants import DAMAGE_TYPE_BITS
+from durin_tcg.enums import CardAbility, CardDamageType, CardElement
+from durin_tcg.models.battle_state import action_for
+from durin_tcg.models.cards import GenshinCard
+from durin_tcg.models.damage import (
+    DAMAGE_PIPELINE,
+    absorb_shield,
+    apply_damage,
+    apply_reaction,
+    run_add_func,
+)
+from durin_tcg.models.game import Battle, Character, Player
+
+if TYPE_CHECKING:
+    from durin_tcg.models.damage import Hit, Stage
+
+
+def make_battle() -> Battle:
+    def deck(name: str, element: CardElement) -> Player:
+        characters = [Character(GenshinCard(f"{name} {i}", "", element)) for i in range(4)]
+        return Player(characters, characters[0])
+
+    return Battle(deck("Attacker", CardElement.GI_PYRO), deck("Target", CardElement.GI_HYDRO))
+
+
+def double_damage(hit: Hit) -> None:
+    hit.damage *= 2
+
+
+class DamagePipelineTest(unittest.TestCase):
+    def set_pipeline(self, stages: list[Stage]) -> None:
+        self.addCleanup(DAMAGE_PIPELINE.__setitem__, slice(None), DAMAGE_PIPELINE[:])
+        DAMAGE_PIPELINE[:] = stages
+
+    def skill_on_target(self, shield: int = 0, auras: int = 0) -> Character:
+        battle = make_battle()
+        target = battle.player2.active_character
+        target.current_shield = shield
+        target.auras = auras
+        battle.step(action_for(CardAbility.SKILL))
+        return target
+
+    def test_default_order(self) -> None:
+        # Pyro on a Hydro aura vaporizes for 2 extra, and the shield soaks 4 of the 5
+        target = self.skill_on_target(shield=4, auras=DAMAGE_TYPE_BITS[CardDamageType.WATER])
+        self.assertEqual((target.current_hp, target.current_shield, target.auras), (9, 0, 0))
+
+    def test_reordering_stages_changes_the_outcome(self) -> None:
+        # The shield now only soaks the 3 base damage, and the reaction bonus goes through
+        self.set_pipeline([absorb_shield, apply_reaction, apply_damage, run_add_func])
+        target = self.skill_on_target(shield=4, auras=DAMAGE_TYPE_BITS[CardDamageType.WATER])
+        self.assertEqual((target.current_hp, target.current_shield), (8, 1))
+
+    def test_inserting_a_stage_changes_the_outcome(self) -> None:
+        self.set_pipeline([apply_reaction, double_damage, absorb_shield, apply_damage])
+        self.assertEqual(self.skill_on_target().current_hp, 4)
+
+    def test_add_func_runs_where_it_is_in_the_pipeline(self) -> None:
+        seen = []
+
+        def hook(allies: list[Character], enemy: Player) -> None:
+            seen.append(enemy.active_character.current_hp)
+            allies[1].current_shield = 2
+
+        for stages in (
+            [apply_reaction, absorb_shield, apply_damage, run_add_func],
+            [run_add_func, apply_reaction, absorb_shield, apply_damage],
+        ):
+            self.set_pipeline(stages)
+            battle = make_battle()
+            battle.player1.active_character.card.skill.add_func = hook
+            battle.step(action_for(CardAbility.SKILL))
+            # Changes the hook makes to other characters are kept
+            self.assertEqual(battle.player1.deck[1].current_shield, 2)
+
+        self.assertEqual(seen, [7, 10])
+
+    def test_use_ability_runs_the_same_stages(self) -> None:
+        battle = make_battle()
+        target = battle.player2.active_character
+        target.auras = DAMAGE_TYPE_BITS[CardDamageType.WATER]
+        battle.player1.use_ability(CardAbility.SKILL, battle.player2)
+        self.assertEqual((target.current_hp, target.auras), (5, 0))
+
+        self.set_pipeline([apply_reaction, double_damage, absorb_shield, apply_damage])
+        battle.player1.use_ability(CardAbility.BASIC, battle.player2)
+        self.assertEqual(target.current_hp, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+"""
+Write-behind persistence of GameData against a temporary user database.
+
+Run from the repository root: python -m unittest discover tests
+"""
+
+from __future__ import annotations
+
+import asyncio
+import pathlib
+import sqlite3
+import tempfile
+import threading
+import unittest
+from unittest import mock
+
+from durin_tcg.models.game_data import GameData
+from durin_tcg.utils.user_store import UserStore
+
+
+class WriteBehindTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = pathlib.Path(tmp.name)
+
+        with (
+            mock.patch("durin_tcg.utils.user_store.USER_DATA_FILE", path / "user_data.json"),
+            mock.patch("durin_tcg.models.game_data.UserStore", lambda: UserStore(path / "u.db")),
+            mock.patch("durin_tcg.models.game_data.read_cards", dict),
+        ):
+            self.game_data = GameData()
+        self.addAsyncCleanup(self.game_data.close)
+
+    async def test_failed_flush_skips_users_evicted_meanwhile(self) -> None:
+        game_data = self.game_data
+        game_data.users.capacity = 1
+        await game_data.fetch_user("1")
+        game_data.add_currency("1", 100)
+        await game_data.flush()
+        game_data.add_currency("1", 50)
+
+        release = threading.Event()
+
+        def failing_append(_changes: object) -> None:
+            release.wait()
+            msg = "disk I/O error"
+            raise sqlite3.OperationalError(msg)
+
+        with mock.patch.object(game_data.store, "append_changes", failing_append):
+            flush = asyncio.create_task(game_data.flush())
+            await asyncio.sleep(0)
+            # Evicting user 1 snapshots it, changes of the flush in flight included
+            game_data.add_user("2")
+            release.set()
+            with self.assertRaises(sqlite3.OperationalError):
+                await flush
+
+        await game_data.flush()
+        user = await game_data._run_in_store(game_data.store.load_user, "1")
+        self.assertEqual(user.currency, 150)
+
+
+if __name__ == "__main__":
+    unittest.main()